@@ -0,0 +1,103 @@
+# admission.py
+import threading
+import time
+from collections import deque
+
+
+class AdmissionController:
+    """Bounds how many API calls run at once and sheds load instead of queueing forever
+
+    Two levels of admission. Every query takes a query slot (enter/leave); there
+    are max_in_flight + max_queued + cheap_reserve of them and none are waited for.
+    Around the upstream call itself an API-backed query also takes an API slot
+    (acquire/release): at most max_in_flight run concurrently and up to max_queued
+    more wait in FIFO order, each for at most queue_timeout seconds. Since API
+    queries can never hold more than max_in_flight + max_queued query slots,
+    cheap_reserve slots always stay free for queries answered locally.
+    """
+
+    def __init__(self, max_in_flight: int = 8, max_queued: int = 32, queue_timeout: float = 2.0,
+                 cheap_reserve: int = 32):
+        self.max_in_flight = max_in_flight
+        self.max_queued = max_queued
+        self.queue_timeout = queue_timeout
+        self.cheap_reserve = cheap_reserve
+
+        self.queries_in_flight = 0
+        self.in_flight = 0
+        self.admitted = 0
+        self.rejected = 0
+        self.shed = 0
+
+        self._cond = threading.Condition()
+        self._waiters = deque()
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    @property
+    def max_queries(self) -> int:
+        return self.max_in_flight + self.max_queued + self.cheap_reserve
+
+    def enter(self) -> bool:
+        """Take a query slot without waiting; False means the process is saturated"""
+        with self._cond:
+            if self.queries_in_flight >= self.max_queries:
+                self.rejected += 1
+                return False
+            self.queries_in_flight += 1
+            return True
+
+    def leave(self):
+        with self._cond:
+            self.queries_in_flight -= 1
+
+    def acquire(self) -> bool:
+        """Take an API slot, waiting in line if needed; False means the caller should back off"""
+        with self._cond:
+            if self.in_flight < self.max_in_flight and not self._waiters:
+                self.in_flight += 1
+                self.admitted += 1
+                return True
+
+            if len(self._waiters) >= self.max_queued:
+                self.rejected += 1
+                return False
+
+            ticket = object()
+            self._waiters.append(ticket)
+            deadline = time.monotonic() + self.queue_timeout
+
+            while True:
+                if self.in_flight < self.max_in_flight and self._waiters[0] is ticket:
+                    self._waiters.popleft()
+                    self.in_flight += 1
+                    self.admitted += 1
+                    # Another slot may still be free for the next waiter in line
+                    self._cond.notify_all()
+                    return True
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._waiters.remove(ticket)
+                    self.shed += 1
+                    self._cond.notify_all()
+                    return False
+                self._cond.wait(remaining)
+
+    def release(self):
+        with self._cond:
+            self.in_flight -= 1
+            self._cond.notify_all()
+
+    def stats(self) -> dict:
+        with self._cond:
+            return {
+                "queries_in_flight": self.queries_in_flight,
+                "in_flight": self.in_flight,
+                "queued": len(self._waiters),
+                "admitted": self.admitted,
+                "rejected": self.rejected,
+                "shed": self.shed,
+            }
@@ -0,0 +1,218 @@
+# analytics.py
+import argparse
+import time
+from array import array
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from conversation_log import ConversationLogReader
+
+KIND_USER = 0
+KIND_BOT = 1
+
+
+class TurnColumns:
+    """Columnar view of conversation turns: one NumPy array per field
+
+    Strings (user ids, response types) are dictionary-encoded into integer codes
+    so every aggregate below is a vectorized operation over flat arrays.
+    """
+
+    def __init__(self, timestamps: np.ndarray, users: np.ndarray, kinds: np.ndarray,
+                 types: np.ndarray, user_names: List[str], type_names: List[str]):
+        self.timestamps = timestamps
+        self.users = users
+        self.kinds = kinds
+        self.types = types
+        self.user_names = user_names
+        self.type_names = type_names
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+
+class _ColumnBuilder:
+    def __init__(self):
+        self.timestamps = array("d")
+        self.users = array("i")
+        self.kinds = array("b")
+        self.types = array("h")
+        self.user_codes: Dict[str, int] = {}
+        self.type_codes: Dict[str, int] = {}
+
+    def add(self, timestamp: float, user_id: str, kind: int, response_type: str):
+        user_code = self.user_codes.get(user_id)
+        if user_code is None:
+            user_code = self.user_codes[user_id] = len(self.user_codes)
+        type_code = self.type_codes.get(response_type)
+        if type_code is None:
+            type_code = self.type_codes[response_type] = len(self.type_codes)
+        self.timestamps.append(timestamp)
+        self.users.append(user_code)
+        self.kinds.append(kind)
+        self.types.append(type_code)
+
+    def build(self) -> TurnColumns:
+        return TurnColumns(
+            np.frombuffer(self.timestamps, dtype=np.float64),
+            np.frombuffer(self.users, dtype=np.int32),
+            np.frombuffer(self.kinds, dtype=np.int8),
+            np.frombuffer(self.types, dtype=np.int16),
+            list(self.user_codes),
+            list(self.type_codes),
+        )
+
+
+def columns_from_sessions(sessions: Dict[str, Dict]) -> TurnColumns:
+    """Convert AIChatBot.sessions history dicts into columns"""
+    builder = _ColumnBuilder()
+    for user_id, session in sessions.items():
+        for entry in session.get("history", []):
+            if entry["type"] == "user":
+                builder.add(entry["timestamp"].timestamp(), user_id, KIND_USER, "")
+            else:
+                builder.add(entry["timestamp"].timestamp(), user_id, KIND_BOT,
+                            entry.get("response_type") or "")
+    return builder.build()
+
+
+def columns_from_log(directory: str, start: Optional[float] = None,
+                     end: Optional[float] = None) -> TurnColumns:
+    """Convert a ConversationLog directory into columns without decoding message text"""
+    builder = _ColumnBuilder()
+    add = builder.add
+    for turn in ConversationLogReader(directory).scan(start=start, end=end, with_text=False):
+        add(turn.timestamp, turn.user_id, KIND_USER if turn.kind == "user" else KIND_BOT,
+            turn.response_type)
+    return builder.build()
+
+
+def synthetic_columns(count: int, users: int = 10000, days: float = 7.0,
+                      seed: int = 0) -> TurnColumns:
+    """Generate count turns of user/bot pairs for benchmarking the report"""
+    rng = np.random.default_rng(seed)
+    type_names = ["", "text", "joke", "weather", "news", "currency", "time", "calculation"]
+    pairs = count // 2
+    asked = np.sort(rng.uniform(0, days * 86400, pairs)) + time.time() - days * 86400
+    answered = asked + rng.lognormal(-2.0, 1.0, pairs)
+    user_codes = rng.integers(0, users, pairs, dtype=np.int32)
+    intents = rng.choice(np.arange(1, len(type_names), dtype=np.int16), pairs,
+                         p=[0.45, 0.1, 0.15, 0.1, 0.08, 0.07, 0.05])
+    return TurnColumns(
+        np.column_stack([asked, answered]).ravel(),
+        np.repeat(user_codes, 2),
+        np.tile(np.array([KIND_USER, KIND_BOT], dtype=np.int8), pairs),
+        np.column_stack([np.zeros(pairs, dtype=np.int16), intents]).ravel(),
+        [f"user_{i}" for i in range(users)],
+        type_names,
+    )
+
+
+def intent_counts(columns: TurnColumns) -> Dict[str, int]:
+    """Count bot replies per response type, most frequent first"""
+    bot_types = columns.types[columns.kinds == KIND_BOT]
+    counts = np.bincount(bot_types, minlength=len(columns.type_names))
+    order = np.argsort(counts)[::-1]
+    return {columns.type_names[i] or "unknown": int(counts[i]) for i in order if counts[i]}
+
+
+def volume_by_bucket(columns: TurnColumns, bucket_seconds: int = 3600) -> Dict[float, int]:
+    """Number of user messages per time bucket, keyed by bucket start (unix time)"""
+    user_ts = columns.timestamps[columns.kinds == KIND_USER]
+    buckets = np.floor_divide(user_ts, bucket_seconds).astype(np.int64)
+    starts, counts = np.unique(buckets, return_counts=True)
+    return {float(s * bucket_seconds): int(c) for s, c in zip(starts, counts)}
+
+
+def hourly_profile(columns: TurnColumns, utc_offset_hours: float = 0.0) -> np.ndarray:
+    """User messages per hour of day (24 bins), to show when traffic peaks"""
+    user_ts = columns.timestamps[columns.kinds == KIND_USER] + utc_offset_hours * 3600
+    hours = (np.floor_divide(user_ts, 3600).astype(np.int64)) % 24
+    return np.bincount(hours, minlength=24)
+
+
+def response_times(columns: TurnColumns) -> tuple:
+    """Pair every user turn with the bot turn that follows it for the same user
+
+    Returns (latencies in seconds, response type code of each reply).
+    """
+    # Stable sort by user then time keeps each user's query/reply pairs adjacent
+    order = np.lexsort((columns.kinds, columns.timestamps, columns.users))
+    users = columns.users[order]
+    kinds = columns.kinds[order]
+    stamps = columns.timestamps[order]
+    types = columns.types[order]
+
+    pairs = (kinds[:-1] == KIND_USER) & (kinds[1:] == KIND_BOT) & (users[:-1] == users[1:])
+    latencies = stamps[1:][pairs] - stamps[:-1][pairs]
+    return latencies, types[1:][pairs]
+
+
+def latency_percentiles(columns: TurnColumns,
+                        percentiles: tuple = (50, 90, 95, 99)) -> Dict[str, Dict[str, float]]:
+    """Response-time percentiles in milliseconds, overall and per response type"""
+    latencies, types = response_times(columns)
+    report = {}
+    if len(latencies):
+        report["all"] = _percentiles(latencies, percentiles)
+    for code, name in enumerate(columns.type_names):
+        selected = latencies[types == code]
+        if len(selected):
+            report[name or "unknown"] = _percentiles(selected, percentiles)
+    return report
+
+
+def _percentiles(values: np.ndarray, percentiles: tuple) -> Dict[str, float]:
+    points = np.percentile(values, percentiles) * 1000.0
+    return {f"p{p}": float(v) for p, v in zip(percentiles, points)}
+
+
+def format_report(columns: TurnColumns, bucket_seconds: int = 3600) -> str:
+    lines = [f"Turns: {len(columns)}  Users: {len(np.unique(columns.users))}", "", "Intent mix:"]
+    counts = intent_counts(columns)
+    total = sum(counts.values()) or 1
+    for name, count in counts.items():
+        lines.append(f"  {name:<12} {count:>10}  {100.0 * count / total:5.1f}%")
+
+    lines += ["", "Response time (ms):"]
+    for name, values in latency_percentiles(columns).items():
+        cells = "  ".join(f"{key}={value:8.1f}" for key, value in values.items())
+        lines.append(f"  {name:<12} {cells}")
+
+    volume = volume_by_bucket(columns, bucket_seconds)
+    if volume:
+        peak_start = max(volume, key=volume.get)
+        peak = datetime.fromtimestamp(peak_start, timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
+        lines += ["", f"Busiest bucket ({bucket_seconds}s): {peak} with {volume[peak_start]} messages"]
+
+    profile = hourly_profile(columns)
+    lines += ["", "Messages by hour of day (UTC):"]
+    lines += [f"  {hour:02d}:00 {int(count):>10}" for hour, count in enumerate(profile)]
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report intent mix, volume and latency from a conversation log")
+    parser.add_argument("log_dir", nargs="?", help="directory written by ConversationLog")
+    parser.add_argument("--bucket", type=int, default=3600, help="volume bucket size in seconds")
+    parser.add_argument("--synthetic", type=int, metavar="TURNS",
+                        help="report on generated turns instead of a log (for benchmarking)")
+    args = parser.parse_args()
+
+    if not args.log_dir and not args.synthetic:
+        parser.error("either log_dir or --synthetic is required")
+
+    started = time.perf_counter()
+    columns = synthetic_columns(args.synthetic) if args.synthetic else columns_from_log(args.log_dir)
+    loaded = time.perf_counter()
+    report = format_report(columns, args.bucket)
+    finished = time.perf_counter()
+
+    print(report)
+    print(f"\nLoaded in {loaded - started:.2f}s, aggregated in {finished - loaded:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+# benchmarks/bench_admission.py
+"""Stress test: a burst of concurrent queries against a saturating upstream API
+
+Compares the configured admission limits with limits too high to ever apply.
+API handlers are replaced with a stand-in provider whose latency grows with the
+number of requests it is serving at once, as a rate-limited or overloaded API does.
+"""
+import os
+import sys
+import threading
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from chatbot_gui import AIChatBot
+from config_loader import Settings
+
+QUERIES = ["what's the weather in london?", "how do I reset my password?",
+           "latest tech news", "tell me a joke", "convert 100 usd to eur", "where is my order?"]
+
+
+class SaturatingProvider:
+    """Serves `capacity` requests in `delay` seconds; more concurrent requests slow everyone down"""
+
+    def __init__(self, delay: float, capacity: int = 8):
+        self.delay = delay
+        self.capacity = capacity
+        self.active = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, query: str) -> str:
+        with self.lock:
+            self.active += 1
+            load = self.active
+        time.sleep(self.delay * max(1.0, load / self.capacity))
+        with self.lock:
+            self.active -= 1
+        return "ok"
+
+
+def percentile(values: list, pct: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct / 100))]
+
+
+def run(clients: int, delay: float, admission: bool) -> dict:
+    settings = Settings() if admission else Settings(max_in_flight=clients, max_queued=clients)
+    chatbot = AIChatBot(seed=0, settings=settings)
+    provider = SaturatingProvider(delay, capacity=Settings().max_in_flight)
+    for intent in chatbot.API_BACKED_INTENTS:
+        chatbot.api_handlers[intent] = provider
+
+    results = {"cheap": [], "api": [], "busy": []}
+    lock = threading.Lock()
+    start = threading.Event()
+
+    def client(n: int):
+        query = QUERIES[n % len(QUERIES)]
+        start.wait()
+        began = time.perf_counter()
+        _, response_type = chatbot.answer_query(f"user_{n}", query)
+        elapsed = time.perf_counter() - began
+        kind = "busy" if response_type == "busy" else ("api" if response_type in chatbot.API_BACKED_INTENTS else "cheap")
+        with lock:
+            results[kind].append(elapsed)
+
+    threads = [threading.Thread(target=client, args=(n,)) for n in range(clients)]
+    for thread in threads:
+        thread.start()
+    start.set()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def main():
+    clients = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    delay = float(sys.argv[2]) if len(sys.argv) > 2 else 0.2
+    print(f"{clients} concurrent clients, upstream latency {delay}s at capacity\n")
+    for admission in (False, True):
+        print("with admission control" if admission else "without admission control")
+        for kind, latencies in run(clients, delay, admission).items():
+            if latencies:
+                print(f"  {kind:<6} n={len(latencies):<5} p50={percentile(latencies, 50) * 1000:8.1f}ms "
+                      f"p99={percentile(latencies, 99) * 1000:8.1f}ms max={max(latencies) * 1000:8.1f}ms")
+        print()
+
+
+if __name__ == "__main__":
+    main()
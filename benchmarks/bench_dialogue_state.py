@@ -0,0 +1,48 @@
+# benchmarks/bench_dialogue_state.py
+"""Show that follow-up resolution costs the same per turn however long the history is
+
+Runs without API keys so every API handler returns immediately and only the
+routing and dialogue-state work is measured.
+"""
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from chatbot_gui import AIChatBot
+from config_loader import load_settings
+
+CONVERSATION = [
+    "what's the weather in london?",
+    "and in paris?",
+    "convert 250 gbp to jpy",
+    "and to eur?",
+    "latest tech news",
+    "what about sports?",
+]
+
+
+def run(turns: int, window: int) -> list:
+    # Defaults only: no API keys, so no network calls
+    chatbot = AIChatBot(seed=0, settings=load_settings(env_file=None, environ={}))
+    timings = []
+    started = time.perf_counter()
+    for turn in range(turns):
+        chatbot.process_query("bench", CONVERSATION[turn % len(CONVERSATION)])
+        if (turn + 1) % window == 0:
+            now = time.perf_counter()
+            timings.append((len(chatbot.get_session_history("bench")), (now - started) / window * 1e6))
+            started = now
+    return timings
+
+
+def main():
+    turns = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    print(f"{'history entries':>15} {'us per turn':>12}")
+    for history, per_turn in run(turns, window=max(1, turns // 10)):
+        print(f"{history:>15} {per_turn:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+# benchmarks/bench_fuzzy_match.py
+"""Per-message cost of typo correction, cold (index lookups) and warm (memoized)"""
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from chatbot_gui import AIChatBot
+from fuzzy_match import TypoCorrector
+
+MESSAGES = [
+    "I forgot my pasword and cant loggin",
+    "whats the wether like in berlinn today",
+    "curency exchnage rate for pounds",
+    "I need a refnd for my last invoce",
+    "can you tell me the lattest technolgy headlins",
+    "where is my delivry, I want to trak my shipmnet",
+]
+
+
+def scramble(word: str, rng: random.Random) -> str:
+    """Introduce one random typo so every token misses the memo cache"""
+    if len(word) < 3:
+        return word
+    i = rng.randrange(1, len(word))
+    return word[:i] + rng.choice("abcdefghijklmnopqrstuvwxyz") + word[i + 1:]
+
+
+def main():
+    messages = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    vocabulary = AIChatBot.fuzzy_vocabulary()
+
+    started = time.perf_counter()
+    corrector = TypoCorrector(vocabulary)
+    print(f"index: {len(corrector.vocabulary)} words, {len(corrector.index)} deletion keys, "
+          f"built in {(time.perf_counter() - started) * 1000:.1f}ms")
+
+    rng = random.Random(0)
+    cold = [" ".join(scramble(w, rng) for w in MESSAGES[n % len(MESSAGES)].split()) for n in range(messages)]
+    corrector = TypoCorrector(vocabulary, cache_size=len(cold) * 8)
+    started = time.perf_counter()
+    for message in cold:
+        corrector.correct(message)
+    cold_us = (time.perf_counter() - started) / len(cold) * 1e6
+
+    started = time.perf_counter()
+    for message in cold:
+        corrector.correct(message)
+    warm_us = (time.perf_counter() - started) / len(cold) * 1e6
+
+    print(f"{messages} messages: cold {cold_us:.1f}us/message, warm {warm_us:.1f}us/message")
+    for message in MESSAGES[:3]:
+        print(f"  {message!r} -> {corrector.correct(message.lower())!r}")
+
+
+if __name__ == "__main__":
+    main()
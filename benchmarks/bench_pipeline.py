@@ -0,0 +1,98 @@
+# benchmarks/bench_pipeline.py
+"""Load test of the full query pipeline against recorded upstream responses
+
+    python benchmarks/bench_pipeline.py record   # once, with real API keys and network
+    python benchmarks/bench_pipeline.py replay [clients] [rounds] [latency|recorded] [jitter]
+
+Replay needs no network or keys and injects the given latency (seconds) with
+uniform jitter, so results are repeatable from run to run; "recorded" replays
+each response after the time it took when recorded.
+"""
+import os
+import sys
+import threading
+import time
+from dataclasses import replace
+from typing import Optional
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from chatbot_gui import AIChatBot
+from config_loader import get_settings
+
+CASSETTE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cassettes", "pipeline.json.gz")
+
+QUERIES = [
+    "what's the weather in london?",
+    "weather in tokyo",
+    "latest technology news",
+    "sports headlines",
+    "convert 250 gbp to jpy",
+    "exchange rate usd to eur",
+    "how do I reset my password?",
+    "tell me a joke",
+]
+
+
+def record():
+    settings = replace(get_settings(), http_mode="record", cassette_path=CASSETTE)
+    chatbot = AIChatBot(seed=0, settings=settings)
+    for query in QUERIES:
+        response, response_type = chatbot.process_query("recorder", query)
+        print(f"[{response_type}] {response.splitlines()[0]}")
+    # Closing the session saves the cassette
+    chatbot.shared.http.close()
+    print(f"\nRecorded to {CASSETTE}")
+
+
+def replay(clients: int, rounds: int, latency: Optional[float], jitter: float):
+    if not os.path.exists(CASSETTE):
+        print(f"No cassette at {CASSETTE}; run with 'record' first. API queries will fail fast.\n")
+    settings = replace(get_settings(), http_mode="replay", cassette_path=CASSETTE,
+                       replay_latency=latency, replay_jitter=jitter,
+                       max_in_flight=clients, max_queued=clients)
+    chatbot = AIChatBot(seed=0, settings=settings)
+    latencies = []
+    lock = threading.Lock()
+
+    def client(n: int):
+        own = []
+        for r in range(rounds):
+            query = QUERIES[(n + r) % len(QUERIES)]
+            began = time.perf_counter()
+            chatbot.answer_query(f"user_{n}", query)
+            own.append(time.perf_counter() - began)
+        with lock:
+            latencies.extend(own)
+
+    threads = [threading.Thread(target=client, args=(n,)) for n in range(clients)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    pick = lambda pct: latencies[min(len(latencies) - 1, int(len(latencies) * pct / 100))] * 1000
+    print(f"{len(latencies)} queries from {clients} clients in {elapsed:.2f}s "
+          f"({len(latencies) / elapsed:.0f} queries/s)")
+    print(f"p50={pick(50):.2f}ms p90={pick(90):.2f}ms p99={pick(99):.2f}ms")
+
+
+def parse_latency(text: str) -> Optional[float]:
+    return None if text == "recorded" else float(text)
+
+
+def main():
+    mode = sys.argv[1] if len(sys.argv) > 1 else "replay"
+    if mode == "record":
+        record()
+    else:
+        args = sys.argv[2:]
+        replay(int(args[0]) if args else 8, int(args[1]) if len(args) > 1 else 200,
+               parse_latency(args[2]) if len(args) > 2 else 0.05, float(args[3]) if len(args) > 3 else 0.02)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+# benchmarks/bench_templates.py
+"""Render cost of compiled reply templates against the inline f-string formatting they replaced"""
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from response_templates import DEFAULT_TEMPLATES, load_templates
+
+WEATHER = dict(city="London", country="GB", temp=12.3, feels_like=10.9, description="light rain",
+               humidity=81, wind_speed=4.1, icon="10d")
+ARTICLES = [{"title": "Markets rally as inflation cools " * 4, "source": {"name": "Reuters"}},
+            {"title": "New battery chemistry doubles range", "source": {"name": "BBC"}},
+            {"title": "Cup final goes to penalties", "source": {"name": "ESPN"}}]
+CURRENCY = dict(base="GBP", base_symbol="£", target="JPY", target_symbol="¥", rate=190.0412,
+                amount=250.0, converted=47510.3, updated="Mon, 19 Oct 2026 00:00:01 +0000")
+
+
+def inline_weather(v):
+    description = v["description"].capitalize()
+    icon_url = f"http://openweathermap.org/img/wn/{v['icon']}@2x.png"
+    return (f"Weather in {v['city']}, {v['country']}:\n"
+            f"• Temperature: {v['temp']}°C (feels like {v['feels_like']}°C)\n"
+            f"• Conditions: {description}\n"
+            f"• Humidity: {v['humidity']}%\n"
+            f"• Wind: {v['wind_speed']} m/s\n"
+            f"• Icon: {icon_url}")
+
+
+def inline_news(category, articles):
+    news_list = []
+    for i, article in enumerate(articles[:3], 1):
+        title = article['title']
+        source = article['source']['name']
+        if len(title) > 100:
+            title = title[:100] + "..."
+        news_list.append(f"{i}. {title} ({source})")
+    return f"Here are the latest {category} news headlines:\n" + "\n".join(news_list)
+
+
+def inline_currency(v):
+    lines = ["Exchange Rate:",
+             f"• {v['base']} ({v['base_symbol']}) to {v['target']} ({v['target_symbol']})",
+             f"• Rate: 1 {v['base']} = {v['rate']:.4f} {v['target']}"]
+    lines.append(f"• {v['amount']:,.2f} {v['base']} = {v['converted']:,.2f} {v['target']}")
+    lines.append(f"• Last updated: {v['updated']}")
+    return "\n".join(lines)
+
+
+def compiled_news(templates, category, articles):
+    headline = templates["news.headline"]
+    headlines = "\n".join([headline(index=i, title=article['title'], source=article['source']['name'])
+                           for i, article in enumerate(articles[:3], 1)])
+    return templates["news.headlines"](category=category, headlines=headlines)
+
+
+def timed(render, renders: int) -> float:
+    started = time.perf_counter()
+    for _ in range(renders):
+        render()
+    return (time.perf_counter() - started) / renders * 1e6
+
+
+def main():
+    renders = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+
+    started = time.perf_counter()
+    catalog = load_templates()
+    compile_ms = (time.perf_counter() - started) * 1000
+    print(f"compiled {len(DEFAULT_TEMPLATES)} templates x {len(catalog.locales)} locales in {compile_ms:.1f}ms")
+
+    templates = catalog.for_locale("en")
+    cases = [
+        ("weather", lambda: inline_weather(WEATHER), lambda: templates["weather.report"](**WEATHER)),
+        ("news", lambda: inline_news("business", ARTICLES), lambda: compiled_news(templates, "business", ARTICLES)),
+        ("currency", lambda: inline_currency(CURRENCY), lambda: templates["currency.conversion"](**CURRENCY)),
+    ]
+    print(f"{renders} renders each:")
+    for name, inline, compiled in cases:
+        if inline() != compiled():
+            print(f"  {name}: output differs from inline formatting!")
+        inline_us = timed(inline, renders)
+        compiled_us = timed(compiled, renders)
+        print(f"  {name:<9} inline {inline_us:.2f}us  compiled {compiled_us:.2f}us  "
+              f"({compiled_us / inline_us:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
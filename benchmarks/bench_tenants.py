@@ -0,0 +1,51 @@
+# benchmarks/bench_tenants.py
+"""Memory cost of each additional tenant: independent bots vs TenantRuntime"""
+import gc
+import os
+import sys
+import tracemalloc
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from chatbot_gui import AIChatBot
+from tenants import TenantConfig, TenantRuntime
+
+
+def tenant_config(n: int) -> TenantConfig:
+    return TenantConfig(tenant_id=f"brand{n}", name=f"Brand {n} Bot",
+                        greetings=[f"Welcome to Brand {n}! How can I help?"],
+                        faq_overrides={"contact": [f"Email support@brand{n}.example.com"]})
+
+
+def measure(build, tenants: int) -> float:
+    """Average bytes allocated per tenant after the first one"""
+    gc.collect()
+    tracemalloc.start()
+    keep = [build(0)]
+    first, _ = tracemalloc.get_traced_memory()
+    keep += [build(n) for n in range(1, tenants)]
+    gc.collect()
+    total, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (total - first) / (tenants - 1)
+
+
+def main():
+    tenants = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+
+    def independent(n: int) -> AIChatBot:
+        config = tenant_config(n)
+        return AIChatBot(tenant_id=config.tenant_id, name=config.name, faq_overrides=config.overrides())
+
+    runtime = TenantRuntime()
+
+    def shared(n: int) -> AIChatBot:
+        return runtime.add_tenant(tenant_config(n))
+
+    print(f"{tenants} tenants, memory per additional tenant:")
+    print(f"  independent AIChatBot: {measure(independent, tenants) / 1024:8.1f} KiB")
+    print(f"  TenantRuntime:         {measure(shared, tenants) / 1024:8.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,16 +3,37 @@ import random
 import re
 import sys
 import requests
+from requests.adapters import HTTPAdapter
 import math
+from collections import ChainMap
 from datetime import datetime, timedelta
+from types import MappingProxyType
 from typing import Dict, List, Any, Optional
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                              QHBoxLayout, QLineEdit, QPushButton,
                              QLabel, QFrame, QScrollArea, QTextEdit, 
                              QComboBox, QSplitter, QSystemTrayIcon, 
-                             QMenu, QAction, QStyle, QToolButton, QStackedWidget)
+                             QMenu, QAction, QStyle, QToolButton, QStackedWidget,
+                             QShortcut)
 from PyQt5.QtCore import Qt, QTimer, QThread, pyqtSignal, QSize
-from PyQt5.QtGui import QIcon, QFont, QPixmap, QColor, QPalette, QMovie
+from PyQt5.QtGui import QIcon, QFont, QPixmap, QColor, QPalette, QMovie, QKeySequence
+
+import http_replay
+from admission import AdmissionController
+from config_loader import Settings, get_settings, install_reload_handler, on_reload
+from conversation_log import ConversationLog
+from dialogue_state import DialogueStateTracker
+from fx_rates import ExchangeRateTable, find_amount
+from fuzzy_match import TypoCorrector, load_common_words
+from introspection import ActiveCounter, InstrumentedSession, IntrospectionServer, Introspector, ProviderStats
+from profiling import QueryProfiler
+from response_selector import ResponseSelector
+from response_templates import load_templates
+from time_zones import TimeService
+
+
+# Stand-in key for API handlers when upstream responses are replayed from a cassette
+REPLAY_API_KEY = "REPLAY_API_KEY"
 
 
 class ChatBotWorker(QThread):
@@ -27,17 +48,64 @@ class ChatBotWorker(QThread):
         self.message = message
 
     def run(self):
-        try:
-            response, message_type = self.chatbot.process_query(self.user_id, self.message)
-            self.response_ready.emit(response, message_type)
-        except Exception as e:
-            self.error_occurred.emit(str(e))
+        with self.chatbot.shared.active_workers:
+            try:
+                response, message_type = self.chatbot.answer_query(self.user_id, self.message)
+                self.response_ready.emit(response, message_type)
+            except Exception as e:
+                self.error_occurred.emit(str(e))
 
 
 class AIChatBot:
-    def __init__(self):
-        self.name = "SupportBot"
+    # Keyword triggers for canned FAQ answers, checked first and in this order
+    FAQ_KEYWORDS = {
+        "greeting": ['hello', 'hi', 'hey', 'greetings', 'hola'],
+        "farewell": ['bye', 'goodbye', 'see you', 'farewell', 'adios'],
+        "features": ['help', 'what can you do', 'support', 'features', 'capabilities'],
+        "account": ['account', 'login', 'password', 'sign in', 'register'],
+        "order": ['order', 'track', 'delivery', 'shipment', 'package'],
+        "payment": ['payment', 'pay', 'credit card', 'bill', 'invoice', 'refund'],
+    }
+    JOKE_KEYWORDS = ['joke', 'funny', 'laugh', 'humor']
+    THANKS_KEYWORDS = ['thank', 'thanks', 'appreciate']
+
+    # Keyword triggers for the intents answered by external APIs or local helpers, in priority order
+    API_INTENT_KEYWORDS = {
+        "weather": ['weather', 'temperature', 'forecast', 'rain', 'sunny', 'cloud'],
+        "news": ['news', 'headlines', 'latest', 'update', 'headline'],
+        "currency": ['exchange', 'currency', 'convert', 'dollar', 'euro', 'pound', 'yen'],
+        "time": ['time', 'date', 'clock', 'calendar', 'day'],
+        "calculation": ['calculate', 'math', 'add', 'subtract', 'multiply', 'divide', 'square', 'root'],
+    }
+
+    # Intents that wait on an external service; everything else is answered locally
+    API_BACKED_INTENTS = ("weather", "news", "currency")
+
+    NEWS_CATEGORIES = {
+        "sports": ['sports', 'sport', 'football', 'basketball', 'tennis'],
+        "technology": ['technology', 'tech', 'computer', 'software', 'ai'],
+        "business": ['business', 'economy', 'finance', 'market', 'stock'],
+        "health": ['health', 'medical', 'medicine', 'hospital', 'doctor'],
+        "entertainment": ['entertainment', 'movie', 'music', 'celebrity', 'film'],
+        "science": ['science', 'scientific', 'research', 'discovery'],
+    }
+
+    CURRENCY_NAMES = {
+        "dollar": "USD", "euro": "EUR", "pound": "GBP", "yen": "JPY",
+        "yuan": "CNY", "rupee": "INR", "ruble": "RUB", "franc": "CHF",
+        "real": "BRL", "peso": "MXN"
+    }
+
+    # Cities recognised in weather questions that don't say "in <city>"
+    WEATHER_CITIES = ['paris', 'new york', 'tokyo', 'berlin', 'moscow', 'beijing', 'sydney']
+
+    def __init__(self, seed: Optional[int] = None, settings: Optional[Settings] = None,
+                 shared: Optional["SharedResources"] = None, tenant_id: Optional[str] = None,
+                 name: Optional[str] = None, faq_overrides: Optional[Dict[str, List[str]]] = None,
+                 locale: Optional[str] = None):
+        self.name = name or "SupportBot"
         self.version = "2.0"
+        self.tenant_id = tenant_id
         self.greetings = [
             "Hello! How can I assist you today?",
             "Hi there! What can I help you with?",
@@ -49,30 +117,93 @@ class AIChatBot:
             "See you later! Feel free to return if you have more questions."
         ]
 
-        # API keys will be injected from environment by run_chatbot.py
-        self.api_keys = {
-            "openweathermap": None,
-            "newsapi": None,
-            "exchange_rate": None,
-        }
+        # Read-only data and process-wide services, shared between tenants when given
+        self.shared = shared or SharedResources(settings or get_settings())
 
-        # Predefined responses for common queries
-        self.faq_responses = self.load_faq_responses()
+        # Every key, limit and timeout comes from the shared configuration layer
+        self.settings = self.shared.settings
+        self.api_keys = self.shared.api_keys
+        self.http = self.shared.http
+
+        # Predefined responses for common queries, with this bot's overrides on top
+        self.faq_responses = self.shared.faq_responses
+        if faq_overrides:
+            # An empty category would leave nothing to reply with
+            empty = sorted(category for category, answers in faq_overrides.items() if not answers)
+            if empty:
+                raise ValueError(f"FAQ overrides with no answers: {', '.join(empty)}")
+            self.faq_responses = ChainMap(faq_overrides, self.shared.faq_responses)
         
         # Jokes database
-        self.jokes = self.load_jokes()
+        self.jokes = self.shared.jokes
         
         # Session data for each user
         self.sessions = {}
+
+        # Per-session response rotation; a seed (or CHATBOT_SEED) makes replies reproducible
+        self.responses = ResponseSelector(seed if seed is not None else self.settings.seed)
         
         # Supported currencies and their symbols
-        self.currencies = {
-            "USD": "$", "EUR": "€", "GBP": "£", "JPY": "¥", 
-            "CAD": "C$", "AUD": "A$", "INR": "₹", "CNY": "¥",
-            "CHF": "Fr", "RUB": "₽", "BRL": "R$", "MXN": "$"
+        self.currencies = self.shared.currencies
+
+        # Compiled reply templates of the API handlers, in this bot's language
+        self.fixed_locale = locale
+        self.locale = locale or self.settings.locale
+        self.templates = self.shared.templates.for_locale(self.locale)
+
+        # One USD rate table serves every currency pair via cross-rates
+        self.fx_rates = self.shared.fx_rates
+
+        # Per-session slots so follow-ups like "and in Paris?" reuse the last intent
+        self.dialogue = DialogueStateTracker(self.API_INTENT_KEYWORDS, self.NEWS_CATEGORIES,
+                                             self.currencies, self.CURRENCY_NAMES, self.shared.places)
+
+        # Spelling correction for messages that match no keyword ("wether", "pasword")
+        self.typo_corrector = self.shared.typo_corrector
+
+        # City-to-time-zone index for "what time is it in ..." questions
+        self.time_service = self.shared.time_service
+
+        # Bounded concurrency with load shedding for traffic spikes
+        self.admission = self.shared.admission
+
+        # Profiles a window of queries on demand; CHATBOT_PROFILE=N profiles the first N
+        self.profiler = QueryProfiler(self, self.settings.profile_dir)
+        if self.settings.profile_requests:
+            self.profiler.start(self.settings.profile_requests, self.settings.profile_mode)
+
+        self.api_handlers = {
+            "weather": self.get_weather_data,
+            "news": self.get_news_data,
+            "currency": self.get_exchange_rate,
+            "time": self.get_current_time,
+            "calculation": self.calculate_expression,
         }
 
-    def load_faq_responses(self) -> Dict[str, List[str]]:
+        # Optional on-disk audit log of every turn, written off the request path
+        self.conversation_log = self.shared.conversation_log
+
+    @staticmethod
+    def resolve_api_keys(settings: Settings) -> Dict[str, Optional[str]]:
+        """API keys to use; replay mode needs no real keys, so placeholders fill the gaps"""
+        keys = settings.api_keys
+        if settings.http_mode == "replay":
+            keys = {service: key or REPLAY_API_KEY for service, key in keys.items()}
+        return keys
+
+    def apply_settings(self, settings: Settings):
+        """Pick up reloaded settings that can change while the bot is running"""
+        if self.shared.settings is not settings:
+            self.shared.apply_settings(settings)
+        self.settings = settings
+        self.api_keys = self.shared.api_keys
+        # Bots without a locale of their own follow the configured one
+        if not self.fixed_locale:
+            self.locale = settings.locale
+            self.templates = self.shared.templates.for_locale(self.locale)
+
+    @staticmethod
+    def load_faq_responses() -> Dict[str, List[str]]:
         """Load predefined FAQ responses from a JSON file"""
         try:
             with open('faq_responses.json', 'r') as f:
@@ -102,10 +233,15 @@ class AIChatBot:
                     "I'm not sure I understand. Could you please rephrase your question?",
                     "I don't have information about that yet. Would you like to speak with a human agent?",
                     "Let me connect you with a customer service representative for further assistance."
+                ],
+                "busy": [
+                    "We're experiencing very high demand right now. Please try again in a moment.",
+                    "I'm handling a lot of requests at the moment. Could you ask me again shortly?"
                 ]
             }
     
-    def load_jokes(self) -> List[str]:
+    @staticmethod
+    def load_jokes() -> List[str]:
         """Load jokes from a JSON file"""
         try:
             with open('jokes.json', 'r') as f:
@@ -124,47 +260,74 @@ class AIChatBot:
                 "What do you call a sleeping bull? A bulldozer!"
             ]
 
-    def get_response(self, user_input: str) -> tuple:
-        """Find the most appropriate response using keyword matching"""
+    def get_response(self, user_input: str, session_id: str = "") -> tuple:
+        """Find the most appropriate response, resolving follow-ups against the session's dialogue state"""
         input_lower = user_input.lower()
 
-        if any(word in input_lower for word in ['hello', 'hi', 'hey', 'greetings', 'hola']):
-            return random.choice(self.faq_responses["greeting"]), "text"
-        if any(word in input_lower for word in ['bye', 'goodbye', 'see you', 'farewell', 'adios']):
-            return random.choice(self.faq_responses["farewell"]), "text"
-        if any(word in input_lower for word in ['help', 'what can you do', 'support', 'features', 'capabilities']):
-            return random.choice(self.faq_responses["features"]), "text"
-        if any(word in input_lower for word in ['account', 'login', 'password', 'sign in', 'register']):
-            return random.choice(self.faq_responses["account"]), "text"
-        if any(word in input_lower for word in ['order', 'track', 'delivery', 'shipment', 'package']):
-            return random.choice(self.faq_responses["order"]), "text"
-        if any(word in input_lower for word in ['payment', 'pay', 'credit card', 'bill', 'invoice', 'refund']):
-            return random.choice(self.faq_responses["payment"]), "text"
-        if any(word in input_lower for word in ['joke', 'funny', 'laugh', 'humor']):
-            return random.choice(self.jokes), "joke"
-        if any(word in input_lower for word in ['thank', 'thanks', 'appreciate']):
+        response, response_type = self.match_response(input_lower, session_id)
+        if response is None:
+            # Only a message no keyword claims can continue the previous question
+            follow_up = self.dialogue.resolve(session_id, input_lower)
+            if follow_up:
+                intent, input_lower = follow_up
+                response, response_type = self.run_handler(intent, input_lower, session_id)
+        if response is None:
+            # Nothing matched as typed; retry once with misspelt keywords corrected
+            corrected = self.typo_corrector.correct(input_lower)
+            if corrected != input_lower:
+                response, response_type = self.match_response(corrected, session_id)
+                if response is not None:
+                    input_lower = corrected
+        if response is None:
+            response = self.responses.choose(session_id, "default", self.faq_responses["default"])
+            response_type = "text"
+
+        # A shed query didn't answer anything, so the previous question stays open
+        if response_type != "busy":
+            self.dialogue.update(session_id, response_type, input_lower)
+        return response, response_type
+
+    def match_response(self, input_lower: str, session_id: str = "") -> tuple:
+        """Find the most appropriate response using keyword matching; (None, None) if nothing matches"""
+        for category, keywords in self.FAQ_KEYWORDS.items():
+            if any(word in input_lower for word in keywords):
+                return self.responses.choose(session_id, category, self.faq_responses[category]), "text"
+        if any(word in input_lower for word in self.JOKE_KEYWORDS):
+            return self.responses.choose(session_id, "joke", self.jokes), "joke"
+        if any(word in input_lower for word in self.THANKS_KEYWORDS):
             return "You're welcome! Is there anything else I can help you with?", "text"
 
-        api_response, response_type = self.process_api_query(input_lower)
-        if api_response:
-            return api_response, response_type
+        return self.process_api_query(input_lower, session_id)
 
-        return random.choice(self.faq_responses["default"]), "text"
+    @classmethod
+    def fuzzy_vocabulary(cls) -> List[str]:
+        """Intent keywords and gazetteer entries the typo corrector may correct towards"""
+        phrases = [word for keywords in cls.FAQ_KEYWORDS.values() for word in keywords]
+        phrases += cls.JOKE_KEYWORDS + cls.THANKS_KEYWORDS
+        phrases += [word for keywords in cls.API_INTENT_KEYWORDS.values() for word in keywords]
+        phrases += [word for keywords in cls.NEWS_CATEGORIES.values() for word in keywords]
+        phrases += list(cls.CURRENCY_NAMES) + cls.WEATHER_CITIES
+        # Short words inside phrases ("what can you do") are too common to correct towards
+        return [word for phrase in phrases for word in phrase.split() if ' ' not in phrase or len(word) >= 5]
 
-    def process_api_query(self, query: str) -> tuple:
+    def process_api_query(self, query: str, session_id: str = "") -> tuple:
         """Process queries that require API integration"""
-        if any(word in query for word in ['weather', 'temperature', 'forecast', 'rain', 'sunny', 'cloud']):
-            return self.get_weather_data(query), "weather"
-        if any(word in query for word in ['news', 'headlines', 'latest', 'update', 'headline']):
-            return self.get_news_data(query), "news"
-        if any(word in query for word in ['exchange', 'currency', 'convert', 'dollar', 'euro', 'pound', 'yen']):
-            return self.get_exchange_rate(query), "currency"
-        if any(word in query for word in ['time', 'date', 'clock', 'calendar', 'day']):
-            return self.get_current_time(query), "time"
-        if any(word in query for word in ['calculate', 'math', 'add', 'subtract', 'multiply', 'divide', 'square', 'root']):
-            return self.calculate_expression(query), "calculation"
+        for intent, keywords in self.API_INTENT_KEYWORDS.items():
+            if any(word in query for word in keywords):
+                return self.run_handler(intent, query, session_id)
         return None, None
 
+    def run_handler(self, intent: str, query: str, session_id: str = "") -> tuple:
+        """Call an intent's handler; API-backed ones hold an admission slot and reply "busy" without one"""
+        if intent not in self.API_BACKED_INTENTS:
+            return self.api_handlers[intent](query), intent
+        if not self.admission.acquire():
+            return self.responses.choose(session_id, "busy", self.faq_responses["busy"]), "busy"
+        try:
+            return self.api_handlers[intent](query), intent
+        finally:
+            self.admission.release()
+
     def get_weather_data(self, query: str) -> str:
         """Get weather data from OpenWeatherMap API"""
         # Extract location from query
@@ -179,8 +342,7 @@ class AIChatBot:
                 break
         # If no location found, check for common city names
         if location == "London":
-            cities = ['paris', 'new york', 'tokyo', 'berlin', 'moscow', 'beijing', 'sydney']
-            for city in cities:
+            for city in self.WEATHER_CITIES:
                 if city in query:
                     location = city
                     break
@@ -188,161 +350,108 @@ class AIChatBot:
         try:
             api_key = self.api_keys["openweathermap"]
             if not api_key:
-                return "Please configure your OpenWeatherMap API key to get weather data."
+                return self.templates["weather.no_key"]()
             
             url = f"http://api.openweathermap.org/data/2.5/weather?q={location}&appid={api_key}&units=metric"
-            response = requests.get(url)
+            response = self.http.get(url, timeout=self.settings.http_timeout)
             response.raise_for_status()
             data = response.json()
             
-            temp = data["main"]["temp"]
-            feels_like = data["main"]["feels_like"]
-            description = data["weather"][0]["description"].capitalize()
-            humidity = data["main"]["humidity"]
-            wind_speed = data["wind"]["speed"]
-            city = data["name"]
-            country = data["sys"]["country"]
-            
-            weather_icon = data["weather"][0]["icon"]
-            icon_url = f"http://openweathermap.org/img/wn/{weather_icon}@2x.png"
-            
-            return (f"Weather in {city}, {country}:\n"
-                   f"• Temperature: {temp}°C (feels like {feels_like}°C)\n"
-                   f"• Conditions: {description}\n"
-                   f"• Humidity: {humidity}%\n"
-                   f"• Wind: {wind_speed} m/s\n"
-                   f"• Icon: {icon_url}")
+            main = data["main"]
+            weather = data["weather"][0]
+            return self.templates["weather.report"](
+                city=data["name"], country=data["sys"]["country"], temp=main["temp"],
+                feels_like=main["feels_like"], description=weather["description"],
+                humidity=main["humidity"], wind_speed=data["wind"]["speed"], icon=weather["icon"])
         except requests.exceptions.RequestException:
-            return f"I couldn't fetch the weather data for {location}. Please try again later or check if the city name is correct."
+            return self.templates["weather.fetch_failed"](location=location)
         except Exception as e:
-            return f"An error occurred while fetching weather data: {str(e)}"
+            return self.templates["weather.error"](error=e)
 
     def get_news_data(self, query: str) -> str:
         """Get news data from NewsAPI"""
         category = "general"
-        if any(word in query for word in ['sports', 'sport', 'football', 'basketball', 'tennis']):
-            category = "sports"
-        elif any(word in query for word in ['technology', 'tech', 'computer', 'software', 'ai']):
-            category = "technology"
-        elif any(word in query for word in ['business', 'economy', 'finance', 'market', 'stock']):
-            category = "business"
-        elif any(word in query for word in ['health', 'medical', 'medicine', 'hospital', 'doctor']):
-            category = "health"
-        elif any(word in query for word in ['entertainment', 'movie', 'music', 'celebrity', 'film']):
-            category = "entertainment"
-        elif any(word in query for word in ['science', 'scientific', 'research', 'discovery']):
-            category = "science"
+        for name, keywords in self.NEWS_CATEGORIES.items():
+            if any(word in query for word in keywords):
+                category = name
+                break
         
         try:
             api_key = self.api_keys["newsapi"]
             if not api_key:
-                return "Please configure your NewsAPI key to get news data."
+                return self.templates["news.no_key"]()
             
             url = f"https://newsapi.org/v2/top-headlines?category={category}&apiKey={api_key}&pageSize=5"
-            response = requests.get(url)
+            response = self.http.get(url, timeout=self.settings.http_timeout)
             response.raise_for_status()
             data = response.json()
             articles = data.get("articles", [])
             
             if not articles:
-                return f"No {category} news found right now. Please try another category."
+                return self.templates["news.empty"](category=category)
             
-            news_list = []
-            for i, article in enumerate(articles[:3], 1):
-                title = article['title']
-                source = article['source']['name']
-                # Shorten very long titles
-                if len(title) > 100:
-                    title = title[:100] + "..."
-                news_list.append(f"{i}. {title} ({source})")
-            
-            return f"Here are the latest {category} news headlines:\n" + "\n".join(news_list)
+            headline = self.templates["news.headline"]
+            headlines = "\n".join([headline(index=i, title=article['title'], source=article['source']['name'])
+                                    for i, article in enumerate(articles[:3], 1)])
+            return self.templates["news.headlines"](category=category, headlines=headlines)
         except requests.exceptions.RequestException:
-            return "I couldn't fetch the latest news. Please check your internet connection or try again later."
+            return self.templates["news.fetch_failed"]()
         except Exception as e:
-            return f"An error occurred while fetching news: {str(e)}"
+            return self.templates["news.error"](error=e)
 
     def get_exchange_rate(self, query: str) -> str:
-        """Get currency exchange rates"""
+        """Get currency exchange rates and convert amounts"""
         base_currency, target_currency = "USD", "EUR"
         
         # Extract currency codes from query
-        words = query.upper().split()
-        codes = list(self.currencies.keys())
-        found = [w for w in words if w in codes]
+        words = re.findall(r'[a-z]+', query.lower())
+        codes = self.currencies
+        found = [w.upper() for w in words if w.upper() in codes]
         
         if len(found) >= 2:
             base_currency, target_currency = found[0], found[1]
         elif len(found) == 1:
             target_currency = found[0]
         else:
-            # Try to find currency symbols or names
-            currency_names = {
-                "dollar": "USD", "euro": "EUR", "pound": "GBP", "yen": "JPY",
-                "yuan": "CNY", "rupee": "INR", "ruble": "RUB", "franc": "CHF",
-                "real": "BRL", "peso": "MXN"
-            }
-            
-            for word in query.lower().split():
+            # Try to find currency names, in the order they were mentioned
+            currency_names = self.CURRENCY_NAMES
+            named = []
+            for word in words:
+                if word.endswith('s') and word[:-1] in currency_names:
+                    word = word[:-1]
                 if word in currency_names:
-                    if base_currency == "USD":
-                        base_currency = currency_names[word]
-                    else:
-                        target_currency = currency_names[word]
-                        break
+                    named.append(currency_names[word])
+            
+            if len(named) >= 2:
+                base_currency, target_currency = named[0], named[1]
+            elif len(named) == 1:
+                base_currency = named[0]
+        
+        # An amount turns the rate lookup into a conversion ("convert 250 GBP to JPY")
+        amount = find_amount(query.lower(), self.shared.currency_words)
         
         try:
             api_key = self.api_keys["exchange_rate"]
             if not api_key:
-                return "Please configure your ExchangeRate API key to get currency data."
+                return self.templates["currency.no_key"]()
             
-            url = f"https://v6.exchangerate-api.com/v6/{api_key}/pair/{base_currency}/{target_currency}"
-            response = requests.get(url)
-            response.raise_for_status()
-            data = response.json()
+            rate = self.fx_rates.rate(base_currency, target_currency, api_key)
+            if rate is None:
+                return self.templates["currency.unavailable"]()
             
-            if data["result"] == "success":
-                rate = data["conversion_rate"]
-                base_symbol = self.currencies.get(base_currency, base_currency)
-                target_symbol = self.currencies.get(target_currency, target_currency)
-                
-                return (f"Exchange Rate:\n"
-                       f"• {base_currency} ({base_symbol}) to {target_currency} ({target_symbol})\n"
-                       f"• Rate: 1 {base_currency} = {rate:.4f} {target_currency}\n"
-                       f"• Last updated: {data['time_last_update_utc']}")
-            else:
-                return "Sorry, I couldn't retrieve the exchange rate at the moment."
+            values = dict(base=base_currency, base_symbol=self.currencies.get(base_currency, base_currency),
+                          target=target_currency, target_symbol=self.currencies.get(target_currency, target_currency),
+                          rate=rate, updated=self.fx_rates.last_updated)
+            if amount is not None:
+                return self.templates["currency.conversion"](amount=amount, converted=amount * rate, **values)
+            return self.templates["currency.rate"](**values)
         except requests.exceptions.RequestException:
-            return "I couldn't fetch the exchange rate. Please check your internet connection or try again later."
+            return self.templates["currency.fetch_failed"]()
         except Exception as e:
-            return f"An error occurred while fetching exchange rates: {str(e)}"
+            return self.templates["currency.error"](error=e)
 
     def get_current_time(self, query: str) -> str:
-        location = "your location"
-        words = query.split()
-        for i, word in enumerate(words):
-            if word in ['in', 'at', 'for', 'of'] and i + 1 < len(words):
-                location = words[i + 1]
-                # Handle multi-word locations
-                if i + 2 < len(words) and words[i + 2] not in ['time', 'date']:
-                    location += " " + words[i + 2]
-                break
-        
-        now = datetime.now()
-        
-        # Add timezone information if location is a known city
-        timezone_info = ""
-        if "london" in location.lower():
-            timezone_info = " (GMT+0/BST)"
-        elif "new york" in location.lower():
-            timezone_info = " (EST/EDT)"
-        elif "tokyo" in location.lower():
-            timezone_info = " (JST)"
-        
-        return (f"Current time in {location.title()}{timezone_info}:\n"
-               f"• Time: {now.strftime('%H:%M:%S')}\n"
-               f"• Date: {now.strftime('%A, %B %d, %Y')}\n"
-               f"• UTC: {datetime.utcnow().strftime('%H:%M:%S')}")
+        return self.time_service.describe(query)
 
     def calculate_expression(self, query: str) -> str:
         try:
@@ -414,6 +523,16 @@ class AIChatBot:
         except Exception as e:
             return f"I couldn't perform that calculation: {str(e)}"
 
+    def answer_query(self, user_id: str, user_input: str) -> tuple:
+        """Run process_query under admission control, replying "busy" when overloaded"""
+        if not self.admission.enter():
+            # Rejected before a session exists, so nothing is remembered for this user
+            return self.responses.pick(self.faq_responses["busy"]), "busy"
+        try:
+            return self.process_query(user_id, user_input)
+        finally:
+            self.admission.leave()
+
     def process_query(self, user_id: str, user_input: str) -> tuple:
         if user_id not in self.sessions:
             self.sessions[user_id] = {
@@ -421,31 +540,131 @@ class AIChatBot:
                 "created_at": datetime.now(),
                 "message_count": 0
             }
+        # Keep a reference so eviction by another thread can't break this turn
+        session = self.sessions[user_id]
         
-        self.sessions[user_id]["history"].append({
+        query_time = datetime.now()
+        session["history"].append({
             "query": user_input, 
-            "timestamp": datetime.now(),
+            "timestamp": query_time,
             "type": "user"
         })
-        self.sessions[user_id]["message_count"] += 1
+        session["message_count"] += 1
+        self.enforce_session_limits(user_id, session)
         
-        response, response_type = self.get_response(user_input)
+        response, response_type = self.get_response(user_input, user_id)
         
-        self.sessions[user_id]["history"].append({
+        response_time = datetime.now()
+        session["history"].append({
             "response": response, 
-            "timestamp": datetime.now(),
+            "timestamp": response_time,
             "type": "bot",
             "response_type": response_type
         })
         
+        if self.conversation_log:
+            # Tenants share one log, so their user ids are namespaced
+            log_user = f"{self.tenant_id}:{user_id}" if self.tenant_id else user_id
+            self.conversation_log.append(log_user, "user", user_input, "", query_time)
+            self.conversation_log.append(log_user, "bot", response, response_type, response_time)
+        
         return response, response_type
 
+    def enforce_session_limits(self, user_id: str, session: Dict):
+        """Trim history and evict the oldest sessions according to the configured limits"""
+        max_history = self.settings.max_history
+        history = session["history"]
+        if max_history and len(history) >= max_history:
+            # Leave room for the reply that is about to be appended
+            del history[:len(history) - max_history + 1]
+
+        max_sessions = self.settings.max_sessions
+        while max_sessions and len(self.sessions) > max_sessions:
+            oldest = next(iter(self.sessions))
+            if oldest == user_id:
+                break
+            self.clear_session(oldest)
+
     def get_session_history(self, user_id: str) -> List[Dict]:
         return self.sessions.get(user_id, {}).get("history", [])
 
     def clear_session(self, user_id: str):
         if user_id in self.sessions:
             del self.sessions[user_id]
+        self.responses.forget(user_id)
+        self.dialogue.forget(user_id)
+
+
+class SharedResources:
+    """Read-only reference data and process-wide services that several bots can share
+
+    FAQ answers, jokes and currencies are frozen into read-only mappings and tuples,
+    so one copy safely serves every tenant, as do the compiled reply templates. The
+    HTTP pool, exchange-rate table, time zone index, admission controller and
+    conversation log are shared too, which keeps upstream calls and concurrency
+    limits process-wide.
+    """
+
+    CURRENCIES = {
+        "USD": "$", "EUR": "€", "GBP": "£", "JPY": "¥", 
+        "CAD": "C$", "AUD": "A$", "INR": "₹", "CNY": "¥",
+        "CHF": "Fr", "RUB": "₽", "BRL": "R$", "MXN": "$"
+    }
+
+    def __init__(self, settings: Settings):
+        self.settings = settings
+        self.api_keys = AIChatBot.resolve_api_keys(settings)
+
+        # Pooled HTTP connections shared by all API handlers, with per-provider error counts
+        self.provider_stats = ProviderStats()
+        self.http = InstrumentedSession(self.provider_stats)
+        adapter = HTTPAdapter(pool_connections=settings.http_pool_connections,
+                              pool_maxsize=settings.http_pool_maxsize)
+        self.http.mount("http://", adapter)
+        self.http.mount("https://", adapter)
+
+        # Record upstream responses to a cassette, or replay them with no network
+        http_replay.install(self.http, settings.http_mode, settings.cassette_path,
+                            self.api_keys.values(), adapter, settings.replay_latency,
+                            settings.replay_jitter, settings.seed)
+
+        self.faq_responses = MappingProxyType({sys.intern(category): tuple(answers)
+                                               for category, answers in AIChatBot.load_faq_responses().items()})
+        self.jokes = tuple(AIChatBot.load_jokes())
+        self.currencies = MappingProxyType(dict(self.CURRENCIES))
+        # Codes, names and symbols that mark a number as an amount of money
+        self.currency_words = frozenset([code.lower() for code in self.CURRENCIES]
+                                        + [symbol.lower() for symbol in self.CURRENCIES.values()]
+                                        + list(AIChatBot.CURRENCY_NAMES))
+
+        self.fx_rates = ExchangeRateTable("USD", settings.fx_cache_ttl, self.http, settings.http_timeout)
+        self.typo_corrector = TypoCorrector(AIChatBot.fuzzy_vocabulary(), cache_size=settings.typo_cache_size,
+                                            known_words=load_common_words())
+        self.time_service = TimeService()
+        # Place names a follow-up question may switch to
+        self.places = frozenset(AIChatBot.WEATHER_CITIES).union(self.time_service.cities)
+        self.templates = load_templates()
+        self.admission = AdmissionController(settings.max_in_flight, settings.max_queued,
+                                             settings.queue_timeout, settings.cheap_reserve)
+
+        # Worker threads currently answering a query
+        self.active_workers = ActiveCounter()
+
+        self.conversation_log = None
+        if settings.log_dir:
+            self.conversation_log = ConversationLog(settings.log_dir, settings.log_segment_bytes,
+                                                    settings.log_max_pending)
+
+    def apply_settings(self, settings: Settings):
+        self.settings = settings
+        self.api_keys = AIChatBot.resolve_api_keys(settings)
+        self.fx_rates.ttl = settings.fx_cache_ttl
+        self.fx_rates.timeout = settings.http_timeout
+        self.typo_corrector.cache_size = settings.typo_cache_size
+        self.admission.max_in_flight = settings.max_in_flight
+        self.admission.max_queued = settings.max_queued
+        self.admission.queue_timeout = settings.queue_timeout
+        self.admission.cheap_reserve = settings.cheap_reserve
 
 
 class MessageWidget(QWidget):
@@ -580,6 +799,10 @@ class ChatWindow(QMainWindow):
         # Create system tray icon
         self.create_system_tray()
 
+        # Hidden shortcut to profile the next 100 queries
+        self.profile_shortcut = QShortcut(QKeySequence("Ctrl+Shift+P"), self)
+        self.profile_shortcut.activated.connect(self.toggle_profiling)
+
     def create_system_tray(self):
         if QSystemTrayIcon.isSystemTrayAvailable():
             self.tray_icon = QSystemTrayIcon(self)
@@ -823,6 +1046,16 @@ class ChatWindow(QMainWindow):
         self.send_button.setEnabled(False)
         self.input_field.setPlaceholderText("Chat has ended. Please close the window.")
 
+    def toggle_profiling(self):
+        profiler = self.chatbot.profiler
+        if profiler.active:
+            outputs = profiler.stop()
+            self.add_message("Profiling stopped. Results written to:\n" + "\n".join(outputs), False, "text")
+        else:
+            profiler.start(100)
+            self.add_message(f"Profiling the next 100 queries into '{profiler.output_dir}'. "
+                             "Press Ctrl+Shift+P again to stop early.", False, "text")
+
     def toggle_theme(self):
         self.dark_mode = not self.dark_mode
         
@@ -902,6 +1135,18 @@ def main():
     
     window = ChatWindow()
     window.show()
+
+    # Health, readiness and live counters on localhost for monitoring
+    if window.chatbot.settings.introspection_port:
+        introspector = Introspector(window.chatbot.shared, {"default": window.chatbot})
+        window.introspection = IntrospectionServer(introspector, window.chatbot.settings.introspection_port).start()
+
+    # Reload configuration on SIGHUP; the timer lets Python run signal handlers under Qt
+    if install_reload_handler():
+        on_reload(window.chatbot.apply_settings)
+        signal_timer = QTimer()
+        signal_timer.timeout.connect(lambda: None)
+        signal_timer.start(500)
     sys.exit(app.exec_())
 
 
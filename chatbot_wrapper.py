@@ -1,13 +1,11 @@
 # chatbot_wrapper.py
-from config_loader import load_api_keys
+from config_loader import get_settings
 
 class AIChatBotWrapper:
     def __init__(self, original_chatbot):
         self.original_chatbot = original_chatbot
-        self.api_keys = load_api_keys()
-        
-        # Override the API keys in the original chatbot
-        self.original_chatbot.api_keys = self.api_keys
+        # Keys come from the shared settings the chatbot was built with
+        self.api_keys = getattr(original_chatbot, "settings", get_settings()).api_keys
         
         # Validate API keys
         self.validate_api_keys()
@@ -1,13 +1,231 @@
 # config_loader.py
+import json
+import math
 import os
-from dotenv import load_dotenv
+import signal
+import threading
+from dataclasses import dataclass, field, fields
+from typing import Callable, Dict, List, Optional, get_args, get_type_hints
 
-def load_api_keys():
+from dotenv import dotenv_values
+
+# Optional JSON settings file; CHATBOT_CONFIG points at a different one
+DEFAULT_CONFIG_FILE = "chatbot_config.json"
+
+
+class ConfigError(ValueError):
+    """Raised when settings fail validation; lists every problem at once"""
+
+
+def _setting(default, env: str, minimum=None):
+    return field(default=default, metadata={"env": env, "minimum": minimum})
+
+
+@dataclass(frozen=True)
+class Settings:
+    """Every tunable of the chatbot, loaded and validated once
+
+    Sources, lowest to highest priority: defaults, the JSON config file,
+    the .env file, then process environment variables.
+    """
+
+    # API keys
+    openweathermap_api_key: Optional[str] = _setting(None, "OPENWEATHERMAP_API_KEY")
+    newsapi_key: Optional[str] = _setting(None, "NEWSAPI_KEY")
+    exchangerate_api_key: Optional[str] = _setting(None, "EXCHANGERATE_API_KEY")
+
+    # Outbound HTTP
+    http_timeout: float = _setting(10.0, "CHATBOT_HTTP_TIMEOUT", minimum=0.1)
+    http_pool_connections: int = _setting(10, "CHATBOT_HTTP_POOL_CONNECTIONS", minimum=1)
+    http_pool_maxsize: int = _setting(10, "CHATBOT_HTTP_POOL_MAXSIZE", minimum=1)
+
+    # Record/replay of upstream responses ("live", "record" or "replay")
+    http_mode: str = _setting("live", "CHATBOT_HTTP_MODE")
+    cassette_path: str = _setting("cassettes/default.json.gz", "CHATBOT_CASSETTE")
+    # Unset replays each response after the time it took when recorded
+    replay_latency: Optional[float] = _setting(None, "CHATBOT_REPLAY_LATENCY", minimum=0)
+    replay_jitter: float = _setting(0.0, "CHATBOT_REPLAY_JITTER", minimum=0)
+
+    # Caches
+    fx_cache_ttl: float = _setting(3600.0, "CHATBOT_FX_CACHE_TTL", minimum=0)
+    typo_cache_size: int = _setting(50000, "CHATBOT_TYPO_CACHE_SIZE", minimum=1)
+
+    # Sessions (0 means unlimited)
+    max_sessions: int = _setting(0, "CHATBOT_MAX_SESSIONS", minimum=0)
+    max_history: int = _setting(0, "CHATBOT_MAX_HISTORY", minimum=0)
+
+    # Concurrency and admission control
+    max_in_flight: int = _setting(8, "CHATBOT_MAX_IN_FLIGHT", minimum=1)
+    max_queued: int = _setting(32, "CHATBOT_MAX_QUEUED", minimum=0)
+    queue_timeout: float = _setting(2.0, "CHATBOT_QUEUE_TIMEOUT", minimum=0)
+    # Query slots that API-backed queries can never take, kept for locally answered ones
+    cheap_reserve: int = _setting(32, "CHATBOT_CHEAP_RESERVE", minimum=0)
+
+    # Conversation log
+    log_dir: Optional[str] = _setting(None, "CHATBOT_LOG_DIR")
+    log_segment_bytes: int = _setting(64 * 1024 * 1024, "CHATBOT_LOG_SEGMENT_BYTES", minimum=4096)
+    log_max_pending: int = _setting(100000, "CHATBOT_LOG_MAX_PENDING", minimum=1)
+
+    # Language of API handler replies; locales without templates fall back to English
+    locale: str = _setting("en", "CHATBOT_LOCALE")
+
+    # Reproducible replies
+    seed: Optional[int] = _setting(None, "CHATBOT_SEED")
+
+    # Localhost port serving /healthz, /readyz, /stats and /memory (0 disables it)
+    introspection_port: int = _setting(0, "CHATBOT_INTROSPECTION_PORT", minimum=0)
+
+    # Profiling
+    profile_requests: int = _setting(0, "CHATBOT_PROFILE", minimum=0)
+    profile_mode: str = _setting("cprofile", "CHATBOT_PROFILE_MODE")
+    profile_dir: str = _setting("profiles", "CHATBOT_PROFILE_DIR")
+
+    @property
+    def api_keys(self) -> Dict[str, Optional[str]]:
+        return {
+            "openweathermap": self.openweathermap_api_key,
+            "newsapi": self.newsapi_key,
+            "exchange_rate": self.exchangerate_api_key,
+        }
+
+    def missing_api_keys(self) -> List[str]:
+        return [service for service, key in self.api_keys.items() if not key]
+
+
+def _convert(value, field_type: type):
+    """Coerce a raw value from a file or the environment to the field's type
+
+    Nothing is silently rounded or reinterpreted: booleans, non-integral numbers
+    for int fields and numbers for str fields are rejected.
+    """
+    if value is None or value == "":
+        return None
+    if isinstance(value, bool) or not isinstance(value, (str, int, float)):
+        raise TypeError(f"{value!r} is not a {field_type.__name__}")
+    if field_type is float:
+        value = float(value)
+        if not math.isfinite(value):
+            raise ValueError(f"{value} is not a finite number")
+        return value
+    if field_type is int:
+        if isinstance(value, float) and not value.is_integer():
+            raise ValueError(f"{value} is not a whole number")
+        return int(value)
+    if not isinstance(value, str):
+        raise TypeError(f"{value!r} is not a string")
+    return value
+
+
+def _field_types() -> Dict[str, type]:
+    """The value type of every setting; Optional[int] means int"""
+    types = {}
+    for name, hint in get_type_hints(Settings).items():
+        args = [arg for arg in get_args(hint) if arg is not type(None)]
+        types[name] = args[0] if args else hint
+    return types
+
+
+def load_settings(config_file: Optional[str] = None, env_file: Optional[str] = ".env",
+                  environ: Optional[Dict[str, str]] = None) -> Settings:
+    """Read settings from every source and validate them"""
+    environ = os.environ if environ is None else environ
+    config_file = config_file or environ.get("CHATBOT_CONFIG", DEFAULT_CONFIG_FILE)
+
+    values = {}
+    errors = []
+
+    file_values = {}
+    if config_file and os.path.exists(config_file):
+        try:
+            with open(config_file, "r") as f:
+                file_values = json.load(f)
+        except (OSError, ValueError) as e:
+            errors.append(f"{config_file}: {e}")
+        if not isinstance(file_values, dict):
+            errors.append(f"{config_file}: expected a JSON object, not {type(file_values).__name__}")
+            file_values = {}
+    dotenv_file = dotenv_values(env_file) if env_file and os.path.exists(env_file) else {}
+
+    field_types = _field_types()
+    known = {f.name for f in fields(Settings)}
+    for name in file_values:
+        if name not in known:
+            errors.append(f"{config_file}: unknown setting '{name}'")
+
+    for f in fields(Settings):
+        env_name = f.metadata["env"]
+        raw = environ.get(env_name, dotenv_file.get(env_name, file_values.get(f.name)))
+        if raw is None:
+            continue
+        field_type = field_types[f.name]
+        try:
+            value = _convert(raw, field_type)
+        except (TypeError, ValueError):
+            errors.append(f"{env_name}={raw!r} is not a valid {field_type.__name__}")
+            continue
+        minimum = f.metadata["minimum"]
+        if minimum is not None and value is not None and value < minimum:
+            errors.append(f"{env_name}={raw!r} must be at least {minimum}")
+            continue
+        if value is not None or f.default is None:
+            values[f.name] = value
+
+    if values.get("profile_mode", "cprofile") not in ("cprofile", "sample"):
+        errors.append(f"CHATBOT_PROFILE_MODE must be 'cprofile' or 'sample', not {values['profile_mode']!r}")
+
+    if values.get("http_mode", "live") not in ("live", "record", "replay"):
+        errors.append(f"CHATBOT_HTTP_MODE must be 'live', 'record' or 'replay', not {values['http_mode']!r}")
+
+    if errors:
+        raise ConfigError("Invalid chatbot configuration:\n  " + "\n  ".join(errors))
+    return Settings(**values)
+
+
+_settings: Optional[Settings] = None
+_settings_lock = threading.Lock()
+_reload_callbacks: List[Callable[[Settings], None]] = []
+
+
+def get_settings() -> Settings:
+    """The process-wide settings, loaded on first use"""
+    global _settings
+    if _settings is None:
+        with _settings_lock:
+            if _settings is None:
+                _settings = load_settings()
+    return _settings
+
+
+def reload_settings() -> Settings:
+    """Re-read every source; on a validation error the previous settings stay in effect"""
+    global _settings
+    settings = load_settings()
+    with _settings_lock:
+        _settings = settings
+    for callback in list(_reload_callbacks):
+        callback(settings)
+    return settings
+
+
+def on_reload(callback: Callable[[Settings], None]):
+    _reload_callbacks.append(callback)
+
+
+def install_reload_handler() -> bool:
+    """Reload settings on SIGHUP where the platform has it"""
+    if not hasattr(signal, "SIGHUP"):
+        return False
+
+    def handle_sighup(signum, frame):
+        try:
+            reload_settings()
+        except ConfigError as e:
+            print(f"Warning: configuration not reloaded.\n{e}")
+
+    signal.signal(signal.SIGHUP, handle_sighup)
+    return True
+
+
+def load_api_keys() -> Dict[str, Optional[str]]:
     """Load API keys from environment variables"""
-    load_dotenv()  # Load environment variables from .env file
-    
-    return {
-        "openweathermap": os.getenv("bd5e378503939ddaee76f12ad7a97608"),
-        "newsapi": os.getenv("293cafc942454bbd90950b7816acd37a"),
-        "exchange_rate": os.getenv("e778d625f6319de9c68586b5")
-    }
\ No newline at end of file
+    return get_settings().api_keys
@@ -0,0 +1,286 @@
+# conversation_log.py
+import atexit
+import mmap
+import os
+import queue
+import struct
+import threading
+from datetime import datetime
+from typing import Dict, Iterator, List, NamedTuple, Optional
+
+# Every segment starts with this magic so readers can reject foreign files
+SEGMENT_MAGIC = b"CLOG\x01"
+SEGMENT_PREFIX = "conversation-"
+SEGMENT_SUFFIX = ".log"
+
+# Record tags
+TAG_STRING = 0
+TAG_USER = 1
+TAG_BOT = 2
+
+# tag, string id, byte length -- followed by the UTF-8 string
+STRING_HEADER = struct.Struct("<BIH")
+# tag, unix timestamp, user id, response type id, text byte length -- followed by the UTF-8 text
+TURN_HEADER = struct.Struct("<BdIII")
+
+KINDS = {TAG_USER: "user", TAG_BOT: "bot"}
+
+
+class Turn(NamedTuple):
+    timestamp: float
+    user_id: str
+    kind: str
+    response_type: str
+    text: str
+
+
+class ConversationLog:
+    """Append-only, segment-rotated log of conversation turns written by a background thread
+
+    User ids and response types are interned into a per-segment string table, so a
+    turn costs a fixed 21-byte header plus its text. Each segment is self-contained.
+
+    A failed write (disk full, say) drops the turns it affects and starts a new
+    segment; the writer keeps running and the loss shows in stats(). At most
+    max_pending turns wait for the writer; further turns are dropped and counted,
+    so a slow disk can't use up memory. The log is closed at interpreter exit, so
+    queued turns are written out.
+    """
+
+    def __init__(self, directory: str, max_segment_bytes: int = 64 * 1024 * 1024, max_pending: int = 100000):
+        self.directory = directory
+        self.max_segment_bytes = max_segment_bytes
+        os.makedirs(directory, exist_ok=True)
+
+        self._queue = queue.Queue(max_pending)
+        self._file = None
+        self._segment_index = self._last_segment_index()
+        self._strings: Dict[str, int] = {}
+        self._closed = False
+        self.dropped = 0
+        self.last_error: Optional[str] = None
+        self._dropped_lock = threading.Lock()
+        self._writer = threading.Thread(target=self._run, name="conversation-log", daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+
+    def append(self, user_id: str, kind: str, text: str, response_type: str = "",
+               timestamp: Optional[datetime] = None):
+        """Queue a turn for writing; never blocks, dropping the turn if the queue is full"""
+        ts = (timestamp or datetime.now()).timestamp()
+        tag = TAG_USER if kind == "user" else TAG_BOT
+        try:
+            self._queue.put_nowait((tag, ts, user_id, response_type or "", text))
+        except queue.Full:
+            self._count_dropped("conversation log queue is full")
+
+    def stats(self) -> dict:
+        return {
+            "pending": self._queue.qsize(),
+            "segment": segment_name(self._segment_index),
+            "writer_alive": self._writer.is_alive(),
+            "dropped": self.dropped,
+            "last_error": self.last_error,
+        }
+
+    def flush(self):
+        """Block until every queued turn has been written to disk"""
+        done = threading.Event()
+        if not self._send(done):
+            return
+        while not done.wait(0.1):
+            if not self._writer.is_alive():
+                return
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        if self._send(None):
+            self._writer.join()
+
+    def _send(self, message) -> bool:
+        """Queue a control message, waiting for room while the writer is still running"""
+        while self._writer.is_alive():
+            try:
+                self._queue.put(message, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def _count_dropped(self, error: str):
+        with self._dropped_lock:
+            self.dropped += 1
+            self.last_error = error
+
+    def _last_segment_index(self) -> int:
+        indexes = [segment_index(name) for name in os.listdir(self.directory)]
+        return max([i for i in indexes if i is not None], default=0)
+
+    def _open_segment(self):
+        if self._file:
+            self._file.close()
+        self._segment_index += 1
+        path = os.path.join(self.directory, segment_name(self._segment_index))
+        self._file = open(path, "ab")
+        self._file.write(SEGMENT_MAGIC)
+        self._strings = {}
+
+    def _intern(self, value: str, out: List[bytes]) -> int:
+        string_id = self._strings.get(value)
+        if string_id is None:
+            string_id = len(self._strings)
+            self._strings[value] = string_id
+            encoded = value.encode("utf-8", "replace")[:0xFFFF]
+            out.append(STRING_HEADER.pack(TAG_STRING, string_id, len(encoded)))
+            out.append(encoded)
+        return string_id
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            batch = [item]
+            # Drain whatever else is waiting so bursts become a single write
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = False
+            for entry in batch:
+                if entry is None:
+                    stop = True
+                elif isinstance(entry, threading.Event):
+                    self._flush()
+                    entry.set()
+                else:
+                    try:
+                        self._write(entry)
+                    except Exception as e:
+                        self._failed(e)
+
+            self._flush()
+            if stop:
+                if self._file:
+                    self._file.close()
+                    self._file = None
+                return
+
+    def _write(self, entry: tuple):
+        tag, ts, user_id, response_type, text = entry
+        if self._file is None or self._file.tell() >= self.max_segment_bytes:
+            self._open_segment()
+
+        out: List[bytes] = []
+        user_sid = self._intern(user_id, out)
+        type_sid = self._intern(response_type, out)
+        # Lone surrogates can't be encoded; they are stored as "?"
+        encoded = text.encode("utf-8", "replace")
+        out.append(TURN_HEADER.pack(tag, ts, user_sid, type_sid, len(encoded)))
+        out.append(encoded)
+        self._file.write(b"".join(out))
+
+    def _flush(self):
+        if self._file:
+            try:
+                self._file.flush()
+            except OSError as e:
+                self._failed(e)
+
+    def _failed(self, error: Exception):
+        """Drop the turn and abandon the segment, which may now end in a partial record"""
+        self._count_dropped(f"{type(error).__name__}: {error}")
+        if self._file:
+            try:
+                self._file.close()
+            except OSError:
+                pass
+        self._file = None
+
+
+class ConversationLogReader:
+    """Memory-mapped scanner over the segments written by ConversationLog"""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    def segments(self) -> List[str]:
+        names = [name for name in os.listdir(self.directory) if segment_index(name) is not None]
+        names.sort(key=segment_index)
+        return [os.path.join(self.directory, name) for name in names]
+
+    def scan(self, user_id: Optional[str] = None, start: Optional[float] = None,
+             end: Optional[float] = None, with_text: bool = True) -> Iterator[Turn]:
+        """Yield turns in write order, optionally filtered by user and [start, end) time range
+
+        Text is only decoded for turns that pass the filters, and not at all when
+        with_text is False.
+        """
+        for path in self.segments():
+            # A segment last written before the window opened cannot contain matches
+            if start is not None and os.path.getmtime(path) < start:
+                continue
+            yield from self._scan_segment(path, user_id, start, end, with_text)
+
+    def count(self, **filters) -> int:
+        return sum(1 for _ in self.scan(**filters))
+
+    def _scan_segment(self, path: str, user_id: Optional[str], start: Optional[float],
+                      end: Optional[float], with_text: bool) -> Iterator[Turn]:
+        if os.path.getsize(path) <= len(SEGMENT_MAGIC):
+            return
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if data[:len(SEGMENT_MAGIC)] != SEGMENT_MAGIC:
+                return
+            strings: List[str] = []
+            wanted_sid = None
+            pos = len(SEGMENT_MAGIC)
+            size = len(data)
+            string_size = STRING_HEADER.size
+            turn_size = TURN_HEADER.size
+
+            while pos < size:
+                tag = data[pos]
+                if tag == TAG_STRING:
+                    if pos + string_size > size:
+                        break
+                    _, string_id, length = STRING_HEADER.unpack_from(data, pos)
+                    pos += string_size
+                    value = data[pos:pos + length].decode("utf-8", "replace")
+                    pos += length
+                    strings.append(value)
+                    if value == user_id:
+                        wanted_sid = string_id
+                    continue
+
+                if pos + turn_size > size:
+                    # Torn tail from a crash mid-write
+                    break
+                tag, ts, user_sid, type_sid, length = TURN_HEADER.unpack_from(data, pos)
+                pos += turn_size
+                text_start = pos
+                pos += length
+                if pos > size:
+                    break
+
+                if user_id is not None and user_sid != wanted_sid:
+                    continue
+                if start is not None and ts < start:
+                    continue
+                if end is not None and ts >= end:
+                    continue
+                text = data[text_start:pos].decode("utf-8", "replace") if with_text else ""
+                yield Turn(ts, strings[user_sid], KINDS.get(tag, "bot"), strings[type_sid], text)
+
+
+def segment_name(index: int) -> str:
+    return f"{SEGMENT_PREFIX}{index:06d}{SEGMENT_SUFFIX}"
+
+
+def segment_index(name: str) -> Optional[int]:
+    if not (name.startswith(SEGMENT_PREFIX) and name.endswith(SEGMENT_SUFFIX)):
+        return None
+    digits = name[len(SEGMENT_PREFIX):-len(SEGMENT_SUFFIX)]
+    return int(digits) if digits.isdigit() else None
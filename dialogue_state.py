@@ -0,0 +1,157 @@
+# dialogue_state.py
+import re
+from typing import Container, Dict, Iterable, List, Optional
+
+from fx_rates import find_amount
+
+# Openers that mark a message as a continuation of the previous question
+FOLLOW_UP_MARKERS = ("and ", "what about ", "how about ", "same for ", "also ")
+
+# Longest place name, in words, looked up in the known places
+MAX_PLACE_WORDS = 3
+
+PREPOSITIONS = {"in", "at", "for", "of"}
+FILLER_WORDS = {"and", "what", "about", "how", "same", "also", "the", "there", "then", "please",
+                "now", "today", "right", "is", "it", "s", "to", "into", "in", "at", "for", "of"}
+
+WORD_RE = re.compile(r"[a-z]+")
+
+
+class DialogueState:
+    """Slots remembered from a session's most recent turns"""
+
+    __slots__ = ("intent", "location", "base_currency", "target_currency", "news_category")
+
+    def __init__(self):
+        self.intent: Optional[str] = None
+        self.location: Optional[str] = None
+        self.base_currency: Optional[str] = None
+        self.target_currency: Optional[str] = None
+        self.news_category: Optional[str] = None
+
+
+class DialogueStateTracker:
+    """Incremental per-session dialogue state used to resolve follow-up questions
+
+    Each turn only looks at the current message and the session's slots, so the
+    cost per turn is independent of how long the conversation has been going.
+    """
+
+    FOLLOW_UP_INTENTS = ("weather", "time", "currency", "news")
+
+    def __init__(self, intent_keywords: Dict[str, List[str]], news_categories: Dict[str, List[str]],
+                 currency_codes: Iterable[str], currency_names: Dict[str, str],
+                 places: Container[str] = frozenset()):
+        self.intent_keywords = intent_keywords
+        self.places = places
+        self.news_categories = news_categories
+        self.currency_codes = set(currency_codes)
+        self.currency_names = currency_names
+        self._currency_words = {code.lower() for code in self.currency_codes}.union(currency_names)
+        self._states: Dict[str, DialogueState] = {}
+
+        # Intent words never count as a place name
+        self._stop_words = set(FILLER_WORDS)
+        for keywords in intent_keywords.values():
+            self._stop_words.update(WORD_RE.findall(" ".join(keywords)))
+
+    def get(self, session_id: str) -> Optional[DialogueState]:
+        return self._states.get(session_id)
+
+    def forget(self, session_id: str):
+        self._states.pop(session_id, None)
+
+    def update(self, session_id: str, intent: Optional[str], query: str):
+        """Record the intent answered for this turn and any slots the query filled"""
+        state = self._states.get(session_id)
+        if state is None:
+            state = self._states.setdefault(session_id, DialogueState())
+        state.intent = intent
+        if intent not in self.FOLLOW_UP_INTENTS:
+            return
+
+        words = WORD_RE.findall(query)
+        if intent in ("weather", "time"):
+            location = self._extract_location(words)
+            if location:
+                state.location = location
+        elif intent == "currency":
+            base, target = self._extract_currencies(words, state)
+            state.base_currency, state.target_currency = base, target
+        elif intent == "news":
+            category = self._extract_news_category(words)
+            if category:
+                state.news_category = category
+
+    def resolve(self, session_id: str, query: str) -> Optional[tuple]:
+        """Turn a follow-up like "and in paris?" into (intent, full query) or return None"""
+        state = self._states.get(session_id)
+        if state is None or state.intent not in self.FOLLOW_UP_INTENTS:
+            return None
+
+        text = query.strip()
+        if not text.startswith(FOLLOW_UP_MARKERS):
+            return None
+
+        # An explicit keyword for some other intent means this is a new question
+        words = WORD_RE.findall(text)
+        present = set(words)
+        for intent, keywords in self.intent_keywords.items():
+            if intent != state.intent and any(
+                    (keyword in text) if " " in keyword else (keyword in present) for keyword in keywords):
+                return None
+
+        if state.intent in ("weather", "time"):
+            location = self._extract_location(words)
+            if not location:
+                return None
+            return state.intent, f"{state.intent} in {location}"
+
+        if state.intent == "currency":
+            if not any(word.upper() in self.currency_codes or word in self.currency_names for word in words):
+                return None
+            base, target = self._extract_currencies(words, state)
+            amount = find_amount(text, self._currency_words)
+            amount_text = f"{amount:.2f} " if amount is not None else ""
+            return "currency", f"convert {amount_text}{base.lower()} to {target.lower()}"
+
+        category = self._extract_news_category(words)
+        if not category:
+            return None
+        return "news", f"{category} news"
+
+    def _extract_location(self, words: List[str]) -> Optional[str]:
+        """The first known place named in the words, preferring the longest name ("new york city")"""
+        for i, word in enumerate(words):
+            if word in self._stop_words:
+                continue
+            for length in range(min(MAX_PLACE_WORDS, len(words) - i), 0, -1):
+                place = " ".join(words[i:i + length])
+                if place in self.places:
+                    return place
+        return None
+
+    def _extract_currencies(self, words: List[str], state: DialogueState) -> tuple:
+        found = []
+        for word in words:
+            code = word.upper()
+            if code not in self.currency_codes:
+                name = word[:-1] if word.endswith("s") and word[:-1] in self.currency_names else word
+                code = self.currency_names.get(name)
+            if code in self.currency_codes:
+                found.append(code)
+
+        base = state.base_currency or "USD"
+        target = state.target_currency or "EUR"
+        if len(found) >= 2:
+            return found[0], found[1]
+        if len(found) == 1:
+            return base, found[0]
+        return base, target
+
+    def _extract_news_category(self, words: List[str]) -> Optional[str]:
+        present = set(words)
+        for category, keywords in self.news_categories.items():
+            if any(word in present for word in keywords):
+                return category
+        return None
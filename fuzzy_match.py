@@ -0,0 +1,149 @@
+# fuzzy_match.py
+import json
+import re
+from typing import Dict, Iterable, List, Optional, Set
+
+WORD_RE = re.compile(r"[a-z]+")
+
+_MISSING = object()
+
+
+def load_common_words() -> List[str]:
+    """The 10,000 most frequent lower-case English words, most frequent first
+
+    common_words.json is taken from the English word probabilities in spaCy's
+    lookups data (MIT). A token found there is a real word, not a typo, however
+    close it is to a keyword. Without the file every token may be corrected.
+    """
+    try:
+        with open('common_words.json', 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return []
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """Optimal string alignment distance (Levenshtein plus transpositions), capped at limit + 1"""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous2 = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        row_min = i
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if previous2 is not None and i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                value = min(value, previous2[j - 2] + 1)
+            current[j] = value
+            row_min = min(row_min, value)
+        if row_min > limit:
+            return limit + 1
+        previous2, previous = previous, current
+    return previous[-1]
+
+
+def deletes(word: str, distance: int) -> Set[str]:
+    """Every string reachable from word by removing up to `distance` characters"""
+    results = {word}
+    frontier = {word}
+    for _ in range(distance):
+        next_frontier = set()
+        for item in frontier:
+            for i in range(len(item)):
+                next_frontier.add(item[:i] + item[i + 1:])
+        results |= next_frontier
+        frontier = next_frontier
+    return results
+
+
+class TypoCorrector:
+    """SymSpell-style spelling correction against a fixed vocabulary
+
+    Every vocabulary word is expanded into its deletions once at build time; a
+    token is corrected by looking up its own deletions in that index and verifying
+    the few candidates with a bounded edit distance. Lookups touch a handful of
+    dict entries regardless of vocabulary size, and results are memoized.
+
+    Short tokens are left alone (too many real words sit one edit from a short
+    keyword), and a correction must keep the token's first letter, which typos
+    rarely change. known_words (see load_common_words) are real words, so they are
+    never corrected, even when they sit close to the vocabulary ("think" is not
+    a typo of "thank").
+    """
+
+    def __init__(self, vocabulary: Iterable[str], min_length: int = 5, max_distance: int = 2,
+                 cache_size: int = 50000, known_words: Iterable[str] = ()):
+        self.min_length = min_length
+        self.max_distance = max_distance
+        self.cache_size = cache_size
+        self.vocabulary: Dict[str, int] = {}
+        self.index: Dict[str, List[str]] = {}
+        self.known_words = frozenset(word.lower() for word in known_words)
+        self._cache: Dict[str, Optional[str]] = {}
+        self.hits = 0
+        self.misses = 0
+
+        for rank, word in enumerate(vocabulary):
+            word = word.lower()
+            if word in self.vocabulary or len(word) < self.min_length - self.max_distance:
+                continue
+            # Earlier words win ties, so callers can list the most important terms first
+            self.vocabulary[word] = rank
+            for variant in deletes(word, self.max_distance):
+                self.index.setdefault(variant, []).append(word)
+
+    def allowed_distance(self, token: str) -> int:
+        if len(token) < self.min_length:
+            return 0
+        return 1 if len(token) < 8 else self.max_distance
+
+    def correct_token(self, token: str) -> Optional[str]:
+        """The vocabulary word token was probably meant to be, or None"""
+        if token in self.vocabulary:
+            return token
+        if token in self.known_words:
+            return None
+        cached = self._cache.get(token, _MISSING)
+        if cached is not _MISSING:
+            self.hits += 1
+            return cached
+        self.misses += 1
+
+        best = None
+        limit = self.allowed_distance(token)
+        if limit:
+            best_key = None
+            seen = set()
+            for variant in deletes(token, limit):
+                for word in self.index.get(variant, ()):
+                    if word in seen or word[0] != token[0]:
+                        continue
+                    seen.add(word)
+                    distance = edit_distance(token, word, limit)
+                    if distance <= limit:
+                        key = (distance, self.vocabulary[word])
+                        if best_key is None or key < best_key:
+                            best, best_key = word, key
+
+        if len(self._cache) >= self.cache_size:
+            self._cache.clear()
+        self._cache[token] = best
+        return best
+
+    def stats(self) -> dict:
+        return {
+            "vocabulary": len(self.vocabulary),
+            "index_keys": len(self.index),
+            "cached": len(self._cache),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def correct(self, text: str) -> str:
+        """Replace misspelt words in lower-case text with their vocabulary spelling"""
+        def replace(match):
+            token = match.group()
+            return self.correct_token(token) or token
+        return WORD_RE.sub(replace, text)
@@ -0,0 +1,135 @@
+# fx_rates.py
+import re
+import threading
+import time
+from typing import Container, Dict, Optional
+
+import requests
+
+AMOUNT_RE = re.compile(r"\d[\d,]*(?:\.\d+)?")
+# Amounts, words and currency symbols, in the order they appear
+TOKEN_RE = re.compile(r"\d[\d,]*(?:\.\d+)?|[a-z]+|[^\w\s]")
+# Words that make the number after them a date rather than an amount ("in 2024")
+DATE_WORDS = {"in", "since", "during", "until", "till", "before", "after", "year"}
+
+# Shortest time a fetched table is kept, even if the provider's next update is already due
+MIN_TTL = 60.0
+# Wait before retrying a failed refresh, doubling on each further failure up to the maximum
+RETRY_BACKOFF = 30.0
+MAX_RETRY_BACKOFF = 900.0
+
+
+def find_amount(text: str, currencies: Container[str]) -> Optional[float]:
+    """The amount of money in lower-case text, or None
+
+    A number only counts next to a currency code, name or symbol ("250 gbp",
+    "$20", "20 dollars") or right after "convert", and never after a date word,
+    so a year or other figure in the question ("exchange rate in 2024 usd to
+    eur") is not taken for an amount.
+    """
+    tokens = TOKEN_RE.findall(text)
+    for i, token in enumerate(tokens):
+        if not AMOUNT_RE.fullmatch(token) or (i and tokens[i - 1] in DATE_WORDS):
+            continue
+        neighbours = tokens[max(0, i - 1):i] + tokens[i + 1:i + 2]
+        if (i and tokens[i - 1] == "convert") or any(
+                word in currencies or (word.endswith("s") and word[:-1] in currencies) for word in neighbours):
+            return float(token.replace(",", ""))
+    return None
+
+
+class ExchangeRateTable:
+    """Keeps one base-currency rate table in memory and derives cross-rates locally
+
+    While refreshes fail (network errors, quota reached) the last good table keeps
+    being served, and retries back off so a struggling provider isn't hit on
+    every query.
+    """
+
+    def __init__(self, base_currency: str = "USD", ttl: float = 3600.0,
+                 http: Optional[requests.Session] = None, timeout: Optional[float] = None):
+        self.base_currency = base_currency
+        self.ttl = ttl
+        self.http = http or requests.Session()
+        self.timeout = timeout
+        self.rates: Dict[str, float] = {}
+        self.last_updated: Optional[str] = None
+        self.fetch_count = 0
+        self.hits = 0
+        self.misses = 0
+        self.failures = 0
+        self._expires_at = 0.0
+        self._retry_at = 0.0
+        self._lock = threading.Lock()
+
+    def is_fresh(self) -> bool:
+        return bool(self.rates) and time.monotonic() < self._expires_at
+
+    def refresh(self, api_key: str) -> bool:
+        """Fetch the whole rate table for the base currency in a single call"""
+        url = f"https://v6.exchangerate-api.com/v6/{api_key}/latest/{self.base_currency}"
+        response = self.http.get(url, timeout=self.timeout)
+        response.raise_for_status()
+        data = response.json()
+        self.fetch_count += 1
+
+        if data.get("result") != "success":
+            return False
+
+        self.rates = data["conversion_rates"]
+        self.last_updated = data.get("time_last_update_utc")
+
+        # Never keep the table past the provider's own next update
+        ttl = self.ttl
+        next_update = data.get("time_next_update_unix")
+        if next_update:
+            ttl = min(ttl, max(MIN_TTL, next_update - time.time()))
+        self._expires_at = time.monotonic() + ttl
+        return True
+
+    def ensure_fresh(self, api_key: str) -> bool:
+        if self.is_fresh():
+            self.hits += 1
+            return True
+        self.misses += 1
+        with self._lock:
+            # Another thread may have refreshed while we waited for the lock
+            if self.is_fresh():
+                return True
+            if time.monotonic() < self._retry_at:
+                return bool(self.rates)
+            error = None
+            try:
+                if self.refresh(api_key):
+                    self.failures = 0
+                    return True
+            except requests.exceptions.RequestException as e:
+                error = e
+            self.failures += 1
+            self._retry_at = time.monotonic() + min(MAX_RETRY_BACKOFF, RETRY_BACKOFF * 2 ** (self.failures - 1))
+            # Slightly stale rates beat no answer
+            if self.rates:
+                return True
+            if error is not None:
+                raise error
+            return False
+
+    def rate(self, base: str, target: str, api_key: str) -> Optional[float]:
+        """Return how many units of target one unit of base buys, or None if unknown"""
+        if not self.ensure_fresh(api_key):
+            return None
+        rates = self.rates
+        if base not in rates or target not in rates:
+            return None
+        return rates[target] / rates[base]
+
+    def stats(self) -> dict:
+        return {
+            "currencies": len(self.rates),
+            "fresh": self.is_fresh(),
+            "failures": self.failures,
+            "last_updated": self.last_updated,
+            "fetches": self.fetch_count,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
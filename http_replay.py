@@ -0,0 +1,156 @@
+# http_replay.py
+import atexit
+import gzip
+import json
+import os
+import random
+import threading
+import time
+from typing import Dict, Iterable, List, Optional
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+MODES = ("live", "record", "replay")
+
+# Only headers that affect how a response body is read are stored
+KEPT_HEADERS = ("Content-Type", "Content-Encoding", "Date")
+
+
+class CassetteStore:
+    """Recorded upstream responses, kept in one gzip-compressed JSON file
+
+    Entries are keyed by "METHOD URL" with API keys masked, so a cassette recorded
+    with real keys replays under any key (or a placeholder). Several recordings of
+    the same request are served round-robin. Recordings are kept in memory and
+    written by save(), which also runs at interpreter exit.
+    """
+
+    def __init__(self, path: str, secrets: Iterable[str] = ()):
+        self.path = path
+        self.secrets = [s for s in secrets if s]
+        self.entries: Dict[str, List[dict]] = {}
+        self._next: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        if os.path.exists(path):
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                self.entries = json.load(f)
+        atexit.register(self.save)
+
+    def key(self, method: str, url: str) -> str:
+        for secret in self.secrets:
+            url = url.replace(secret, "***")
+        return f"{method} {url}"
+
+    def get(self, method: str, url: str) -> Optional[dict]:
+        key = self.key(method, url)
+        with self._lock:
+            recordings = self.entries.get(key)
+            if not recordings:
+                return None
+            index = self._next.get(key, 0)
+            self._next[key] = (index + 1) % len(recordings)
+            return recordings[index]
+
+    def add(self, method: str, url: str, response: requests.Response):
+        entry = {
+            "status": response.status_code,
+            "reason": response.reason,
+            "headers": {name: response.headers[name] for name in KEPT_HEADERS if name in response.headers},
+            "body": response.content.decode("utf-8", "replace"),
+            "elapsed": response.elapsed.total_seconds(),
+        }
+        with self._lock:
+            self.entries.setdefault(self.key(method, url), []).append(entry)
+            self._dirty = True
+
+    def save(self):
+        """Write the cassette if anything was recorded since the last save"""
+        with self._lock:
+            if not self._dirty:
+                return
+            self._write()
+            self._dirty = False
+
+    def _write(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # Write to a temporary file first so a crash never leaves a truncated cassette
+        temp_path = self.path + ".tmp"
+        with gzip.open(temp_path, "wt", encoding="utf-8") as f:
+            json.dump(self.entries, f, separators=(",", ":"))
+        os.replace(temp_path, self.path)
+
+
+class CassetteAdapter(BaseAdapter):
+    """Transport adapter that records real responses or replays them from a cassette
+
+    In replay mode each response is delayed by latency seconds plus uniform jitter
+    (drawn from a seeded RNG so runs are repeatable); with latency None the delay
+    is how long the recorded request took. A request with no recording
+    fails with ConnectionError, just as an unreachable provider would.
+    """
+
+    def __init__(self, store: CassetteStore, mode: str = "replay", live_adapter: Optional[BaseAdapter] = None,
+                 latency: Optional[float] = 0.0, jitter: float = 0.0, seed: Optional[int] = 0):
+        super().__init__()
+        if mode not in ("record", "replay"):
+            raise ValueError(f"CassetteAdapter mode must be 'record' or 'replay', not {mode!r}")
+        self.store = store
+        self.mode = mode
+        self.live_adapter = live_adapter or requests.adapters.HTTPAdapter()
+        self.latency = latency
+        self.jitter = jitter
+        self._rng = random.Random(seed)
+        self._rng_lock = threading.Lock()
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        if self.mode == "record":
+            response = self.live_adapter.send(request, stream=stream, timeout=timeout, verify=verify,
+                                              cert=cert, proxies=proxies)
+            self.store.add(request.method, request.url, response)
+            return response
+
+        entry = self.store.get(request.method, request.url)
+        if entry is None:
+            raise requests.exceptions.ConnectionError(
+                f"No recorded response for {self.store.key(request.method, request.url)}", request=request)
+
+        delay = entry.get("elapsed", 0.0) if self.latency is None else self.latency
+        if self.jitter:
+            with self._rng_lock:
+                delay += self._rng.uniform(-self.jitter, self.jitter)
+        if delay > 0:
+            time.sleep(delay)
+        return build_response(request, entry)
+
+    def close(self):
+        self.store.save()
+        self.live_adapter.close()
+
+
+def build_response(request, entry: dict) -> requests.Response:
+    response = requests.Response()
+    response.status_code = entry["status"]
+    response.reason = entry.get("reason")
+    response.headers = CaseInsensitiveDict(entry.get("headers", {}))
+    response._content = entry["body"].encode("utf-8")
+    response.encoding = "utf-8"
+    response.url = request.url
+    response.request = request
+    return response
+
+
+def install(session: requests.Session, mode: str, cassette_path: str, secrets: Iterable[str] = (),
+            live_adapter: Optional[BaseAdapter] = None, latency: Optional[float] = 0.0, jitter: float = 0.0,
+            seed: Optional[int] = 0) -> Optional[CassetteAdapter]:
+    """Mount a cassette adapter on the session for record/replay; "live" leaves it untouched"""
+    if mode == "live":
+        return None
+    adapter = CassetteAdapter(CassetteStore(cassette_path, secrets), mode, live_adapter, latency, jitter, seed)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return adapter
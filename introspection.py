@@ -0,0 +1,316 @@
+# introspection.py
+import gc
+import json
+import sys
+import threading
+import time
+import tracemalloc
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import FunctionType, MappingProxyType, MethodType, ModuleType
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Upstream hosts and the provider names used in API keys and stats
+PROVIDER_HOSTS = {
+    "api.openweathermap.org": "openweathermap",
+    "newsapi.org": "newsapi",
+    "v6.exchangerate-api.com": "exchange_rate",
+}
+
+# Error rate over the recent window above which a provider is reported as failing
+FAILING_ERROR_RATE = 0.5
+
+# Leaves of the object graph; their size doesn't depend on what they refer to
+_ATOMIC = (str, bytes, bytearray, int, float, complex, bool, type(None), type, ModuleType,
+           FunctionType, MethodType)
+
+
+class ProviderStats:
+    """Call counts, error rates and latencies of each upstream provider
+
+    Recording a call is a lock, a few increments and an append to a bounded
+    window, so it is cheap enough to do on every request.
+    """
+
+    def __init__(self, window: int = 100):
+        self.window = window
+        self._providers: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    def record(self, provider: str, ok: bool, seconds: float, error: Optional[str] = None):
+        with self._lock:
+            stats = self._providers.get(provider)
+            if stats is None:
+                stats = self._providers[provider] = {
+                    "calls": 0, "errors": 0, "seconds": 0.0, "last_error": None,
+                    "recent": deque(maxlen=self.window),
+                }
+            stats["calls"] += 1
+            stats["seconds"] += seconds
+            stats["recent"].append(ok)
+            if not ok:
+                stats["errors"] += 1
+                stats["last_error"] = error
+
+    def stats(self) -> dict:
+        with self._lock:
+            report = {}
+            for provider, stats in self._providers.items():
+                recent = stats["recent"]
+                report[provider] = {
+                    "calls": stats["calls"],
+                    "errors": stats["errors"],
+                    "error_rate": stats["errors"] / stats["calls"],
+                    "recent_error_rate": recent.count(False) / len(recent),
+                    "avg_latency_ms": stats["seconds"] / stats["calls"] * 1000,
+                    "last_error": stats["last_error"],
+                }
+            return report
+
+    def failing(self) -> list:
+        return [provider for provider, stats in self.stats().items()
+                if stats["recent_error_rate"] > FAILING_ERROR_RATE]
+
+
+class ActiveCounter:
+    """Counts the threads currently inside a `with` block"""
+
+    def __init__(self):
+        self.value = 0
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        with self._lock:
+            self.value += 1
+        return self
+
+    def __exit__(self, *exc_info):
+        with self._lock:
+            self.value -= 1
+
+
+class InstrumentedSession(requests.Session):
+    """requests.Session that reports every upstream call to ProviderStats
+
+    Connection errors and HTTP error statuses both count as failures.
+    """
+
+    def __init__(self, provider_stats: ProviderStats):
+        super().__init__()
+        self.provider_stats = provider_stats
+
+    def send(self, request, **kwargs):
+        host = urlsplit(request.url).hostname or ""
+        provider = PROVIDER_HOSTS.get(host, host)
+        started = time.perf_counter()
+        try:
+            response = super().send(request, **kwargs)
+        except requests.exceptions.RequestException as e:
+            self.provider_stats.record(provider, False, time.perf_counter() - started, type(e).__name__)
+            raise
+        ok = response.status_code < 400
+        self.provider_stats.record(provider, ok, time.perf_counter() - started,
+                                   None if ok else f"HTTP {response.status_code}")
+        return response
+
+
+def deep_sizeof(obj, seen: Optional[set] = None) -> int:
+    """Bytes held by obj and everything it refers to, counting shared objects once per seen set"""
+    seen = set() if seen is None else seen
+    size = 0
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        size += sys.getsizeof(item)
+        if isinstance(item, _ATOMIC):
+            continue
+        if isinstance(item, (dict, MappingProxyType)):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset, deque)):
+            stack.extend(item)
+        elif hasattr(item, "maps"):  # ChainMap
+            stack.extend(item.maps)
+        else:
+            if hasattr(item, "__dict__"):
+                stack.append(vars(item))
+            for slot in getattr(type(item), "__slots__", ()):
+                if hasattr(item, slot):
+                    stack.append(getattr(item, slot))
+    return size
+
+
+class Introspector:
+    """Health, readiness, live counters and memory usage of a running chatbot process
+
+    Works from the bots' existing state and counters, so nothing is added to the
+    request path beyond the provider and cache counters. `bots` is a live mapping
+    of name to AIChatBot (the GUI's single bot, or TenantRuntime.bots).
+    """
+
+    def __init__(self, shared, bots: Dict[str, object]):
+        self.shared = shared
+        self.bots = bots
+        self.started_at = time.time()
+
+    def health(self) -> dict:
+        """Liveness: the process is up and can answer"""
+        return {"status": "ok", "uptime_seconds": round(time.time() - self.started_at, 1)}
+
+    def readiness(self) -> dict:
+        """Whether new queries should be sent here; failing providers only degrade it"""
+        admission = self.shared.admission.stats()
+        log = self.shared.conversation_log
+        limits = self.shared.admission
+        checks = {
+            "bots_loaded": bool(self.bots),
+            "accepting_queries": admission["queries_in_flight"] < limits.max_queries,
+            "conversation_log": log is None or log.stats()["writer_alive"],
+        }
+        failing = self.shared.provider_stats.failing()
+        ready = all(checks.values())
+        status = "ready" if ready and not failing else "degraded" if ready else "not_ready"
+        return {"status": status, "ready": ready, "checks": checks, "failing_providers": failing}
+
+    def stats(self) -> dict:
+        """Live counters; cheap enough to poll every few seconds"""
+        bots = {}
+        for name, bot in list(self.bots.items()):
+            sessions = list(bot.sessions.values())
+            bots[name] = {
+                "sessions": len(sessions),
+                "messages": sum(session["message_count"] for session in sessions),
+                "locale": bot.locale,
+            }
+        shared = self.shared
+        return {
+            "uptime_seconds": round(time.time() - self.started_at, 1),
+            "bots": bots,
+            "sessions": sum(bot["sessions"] for bot in bots.values()),
+            "admission": shared.admission.stats(),
+            "workers": {"running": shared.active_workers.value, "threads": threading.active_count()},
+            "providers": shared.provider_stats.stats(),
+            "caches": {
+                "fx_rates": shared.fx_rates.stats(),
+                "typo_corrector": shared.typo_corrector.stats(),
+                "time_service": shared.time_service.stats(),
+            },
+            "conversation_log": shared.conversation_log.stats() if shared.conversation_log else None,
+        }
+
+    def memory(self, top: int = 10) -> dict:
+        """Bytes held by each component; walks the object graph, so only run on demand
+
+        Shared data is measured first and counted once, so per-bot figures are what
+        each bot holds on its own.
+        """
+        shared = self.shared
+        seen = set()
+        components = {
+            "faq_responses": deep_sizeof(shared.faq_responses, seen),
+            "jokes": deep_sizeof(shared.jokes, seen),
+            "templates": deep_sizeof(shared.templates.locales, seen),
+            "typo_index": deep_sizeof(shared.typo_corrector, seen),
+            "time_zones": deep_sizeof(shared.time_service, seen),
+            "fx_rates": deep_sizeof(shared.fx_rates.rates, seen),
+        }
+        bots = {}
+        for name, bot in list(self.bots.items()):
+            bots[name] = {
+                "sessions": deep_sizeof(dict(bot.sessions), seen),
+                "response_rotations": deep_sizeof(bot.responses._sessions, seen),
+                "dialogue_state": deep_sizeof(bot.dialogue._states, seen),
+            }
+
+        report = {
+            "shared": components,
+            "bots": bots,
+            "gc_objects": len(gc.get_objects()),
+            "peak_rss_bytes": None,
+            "tracemalloc": None,
+        }
+        if resource is not None:
+            peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            # ru_maxrss is in kilobytes on Linux and bytes on macOS
+            report["peak_rss_bytes"] = peak if sys.platform == "darwin" else peak * 1024
+        if tracemalloc.is_tracing():
+            snapshot = tracemalloc.take_snapshot()
+            report["tracemalloc"] = [{"location": str(stat.traceback), "bytes": stat.size, "blocks": stat.count}
+                                     for stat in snapshot.statistics("lineno")[:top]]
+        return report
+
+
+class IntrospectionServer:
+    """Serves the Introspector as JSON over HTTP on a localhost port, from a daemon thread
+
+        GET /healthz   liveness
+        GET /readyz    readiness (503 when not ready)
+        GET /stats     live counters
+        GET /memory    memory breakdown (walks the heap; slow on big processes)
+    """
+
+    def __init__(self, introspector: Introspector, port: int = 0, host: str = "127.0.0.1"):
+        self.introspector = introspector
+        self.server = ThreadingHTTPServer((host, port), self._handler_class())
+        self.server.daemon_threads = True
+        self._thread = threading.Thread(target=self.server.serve_forever, name="introspection", daemon=True)
+
+    @property
+    def address(self) -> tuple:
+        return self.server.server_address[:2]
+
+    def start(self) -> "IntrospectionServer":
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _handler_class(self):
+        introspector = self.introspector
+
+        class Handler(BaseHTTPRequestHandler):
+            routes = {
+                "/healthz": introspector.health,
+                "/readyz": introspector.readiness,
+                "/stats": introspector.stats,
+                "/memory": introspector.memory,
+            }
+
+            def do_GET(self):
+                route = self.routes.get(urlsplit(self.path).path.rstrip("/"))
+                if route is None:
+                    self._send(404, {"error": "not found", "endpoints": sorted(self.routes)})
+                    return
+                try:
+                    body = route()
+                except Exception as e:
+                    self._send(500, {"error": str(e)})
+                    return
+                status = 503 if route == introspector.readiness and not body["ready"] else 200
+                self._send(status, body)
+
+            def _send(self, status: int, body: dict):
+                data = json.dumps(body, indent=2, default=str).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
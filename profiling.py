@@ -0,0 +1,228 @@
+# profiling.py
+import cProfile
+import io
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Dict, List, Optional
+
+MODES = ("cprofile", "sample")
+
+
+class QueryProfiler:
+    """Profiles a window of N process_query calls on a live chatbot
+
+    While inactive nothing is wrapped, so there is no overhead at all. start()
+    shadows the bot's process_query with a profiling wrapper; after N requests
+    (or stop()) the wrapper is removed and the results are written to output_dir:
+
+    - "cprofile" mode: a .pstats file plus a text summary of the hottest functions
+    - "sample" mode: collapsed stacks (flamegraph.pl / speedscope format) plus a summary
+
+    In cprofile mode each worker thread gets its own profiler, so profiled requests
+    still run concurrently; the per-thread profiles are merged when written.
+    """
+
+    def __init__(self, chatbot, output_dir: str = "profiles", top: int = 20,
+                 sample_interval: float = 0.001):
+        self.chatbot = chatbot
+        self.output_dir = output_dir
+        self.top = top
+        self.sample_interval = sample_interval
+
+        self.mode = "cprofile"
+        self.remaining = 0
+        self.last_outputs: List[str] = []
+        self._lock = threading.Lock()
+        self._stats: Optional[pstats.Stats] = None
+        self._profiles: List[cProfile.Profile] = []
+        self._thread_profiles = threading.local()
+        self._in_flight = 0
+        self._idle = threading.Condition(self._lock)
+        self._samples: Counter = Counter()
+        self._sampled_threads: Dict[int, int] = {}
+        self._sampler: Optional[threading.Thread] = None
+        self._started_at = 0.0
+
+    @property
+    def active(self) -> bool:
+        return "process_query" in vars(self.chatbot)
+
+    def start(self, requests: int = 100, mode: str = "cprofile"):
+        if mode not in MODES:
+            raise ValueError(f"Unknown profiling mode {mode!r}; expected one of {', '.join(MODES)}")
+        with self._lock:
+            if self.active:
+                return
+            self.mode = mode
+            self.remaining = requests
+            self._stats = None
+            self._profiles = []
+            self._thread_profiles = threading.local()
+            self._samples = Counter()
+            self._sampled_threads = {}
+            self._started_at = time.time()
+            original = type(self.chatbot).process_query.__get__(self.chatbot)
+            wrapper = self._profile_cprofile if mode == "cprofile" else self._profile_sampled
+
+            def process_query(user_id: str, user_input: str) -> tuple:
+                return wrapper(original, user_id, user_input)
+
+            self.chatbot.process_query = process_query
+            if mode == "sample":
+                self._sampler = threading.Thread(target=self._sample_loop, name="query-profiler", daemon=True)
+                self._sampler.start()
+
+    def stop(self) -> List[str]:
+        """End the window early (or after the last request) and write the results"""
+        with self._lock:
+            if not self.active:
+                return self.last_outputs
+            del self.chatbot.process_query
+            self.remaining = 0
+            # Profiles are only read once no request is still adding to them
+            while self._in_flight:
+                self._idle.wait()
+        if self._sampler:
+            self._sampler.join()
+            self._sampler = None
+        self.last_outputs = self._write()
+        return self.last_outputs
+
+    def _count_request(self):
+        with self._lock:
+            self.remaining -= 1
+            done = self.remaining == 0
+        if done:
+            # Write results off the request thread
+            threading.Thread(target=self.stop, name="query-profiler-writer", daemon=True).start()
+
+    def _profile_cprofile(self, original, user_id: str, user_input: str) -> tuple:
+        with self._lock:
+            profiling = self.active
+            if profiling:
+                self._in_flight += 1
+        if not profiling:
+            # The window closed after this request picked up the wrapper
+            return original(user_id, user_input)
+
+        profile = getattr(self._thread_profiles, "profile", None)
+        if profile is None:
+            profile = self._thread_profiles.profile = cProfile.Profile()
+            with self._lock:
+                self._profiles.append(profile)
+        try:
+            try:
+                profile.enable()
+            except ValueError:
+                # Python 3.12+ allows one active profiler per process; run this request unprofiled
+                return original(user_id, user_input)
+            try:
+                return original(user_id, user_input)
+            finally:
+                profile.disable()
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+                self._idle.notify_all()
+            self._count_request()
+
+    def _profile_sampled(self, original, user_id: str, user_input: str) -> tuple:
+        thread_id = threading.get_ident()
+        self._sampled_threads[thread_id] = self._sampled_threads.get(thread_id, 0) + 1
+        try:
+            return original(user_id, user_input)
+        finally:
+            if self._sampled_threads[thread_id] == 1:
+                del self._sampled_threads[thread_id]
+            else:
+                self._sampled_threads[thread_id] -= 1
+            self._count_request()
+
+    def _sample_loop(self):
+        while self.active:
+            frames = sys._current_frames()
+            for thread_id in list(self._sampled_threads):
+                frame = frames.get(thread_id)
+                if frame is not None:
+                    self._samples[collapse_stack(frame)] += 1
+            time.sleep(self.sample_interval)
+
+    def _write(self) -> List[str]:
+        os.makedirs(self.output_dir, exist_ok=True)
+        outputs = []
+        if self.mode == "cprofile" and not self._profiles:
+            return outputs
+        base = self._claim_output_base()
+
+        if self.mode == "cprofile":
+            self._stats = pstats.Stats(self._profiles[0])
+            for profile in self._profiles[1:]:
+                self._stats.add(profile)
+            self._stats.dump_stats(base + ".pstats")
+            outputs.append(base + ".pstats")
+            summary = self._cprofile_summary()
+        else:
+            with open(base + ".collapsed", "w") as f:
+                for stack, count in self._samples.most_common():
+                    f.write(f"{stack} {count}\n")
+            outputs.append(base + ".collapsed")
+            summary = self._sample_summary()
+
+        with open(base + ".txt", "w") as f:
+            f.write(summary)
+        outputs.append(base + ".txt")
+        return outputs
+
+    def _claim_output_base(self) -> str:
+        """A path prefix no other window has used, reserved by creating its .txt file
+
+        Windows started in the same second get "-2", "-3", ... suffixes.
+        """
+        stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(self._started_at))
+        base = os.path.join(self.output_dir, f"profile-{stamp}")
+        suffix = 1
+        while True:
+            try:
+                open(base + ".txt", "x").close()
+                return base
+            except FileExistsError:
+                suffix += 1
+                base = os.path.join(self.output_dir, f"profile-{stamp}-{suffix}")
+
+    def _cprofile_summary(self) -> str:
+        out = io.StringIO()
+        stats = self._stats
+        stats.stream = out
+        stats.strip_dirs()
+        out.write("Top functions by own time:\n")
+        stats.sort_stats("tottime").print_stats(self.top)
+        out.write("\nTop functions by cumulative time:\n")
+        stats.sort_stats("cumulative").print_stats(self.top)
+        return out.getvalue()
+
+    def _sample_summary(self) -> str:
+        total = sum(self._samples.values())
+        own: Counter = Counter()
+        for stack, count in self._samples.items():
+            own[stack.rsplit(";", 1)[-1]] += count
+        lines = [f"{total} samples every {self.sample_interval * 1000:.1f}ms", "",
+                 "Top functions by own samples:"]
+        for function, count in own.most_common(self.top):
+            lines.append(f"  {100.0 * count / total:5.1f}%  {count:>7}  {function}")
+        if not total:
+            lines.append("  (no samples; the window was shorter than the sample interval)")
+        return "\n".join(lines) + "\n"
+
+
+def collapse_stack(frame) -> str:
+    """Render a frame chain as "outer;...;inner" with file:function names"""
+    names = []
+    while frame is not None:
+        code = frame.f_code
+        names.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+        frame = frame.f_back
+    return ";".join(reversed(names))
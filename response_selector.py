@@ -0,0 +1,77 @@
+# response_selector.py
+import random
+from typing import Dict, List, Optional, Sequence
+
+
+class _Rotation:
+    """Shuffled order over one category's responses, reshuffled once exhausted"""
+
+    __slots__ = ("order", "position")
+
+    def __init__(self):
+        self.order: List[int] = []
+        self.position = 0
+
+
+class _SessionState:
+    __slots__ = ("rng", "rotations")
+
+    def __init__(self, rng: random.Random):
+        self.rng = rng
+        self.rotations: Dict[str, _Rotation] = {}
+
+
+class ResponseSelector:
+    """Picks canned responses from per-session RNGs in a non-repeating rotation
+
+    Every session owns its RNG, so worker threads never share random state and no
+    lock is needed. With a seed, each session's RNG is derived from (seed, session)
+    and the sequence of replies is reproducible across runs. Within a category a
+    response is not repeated until all the others have been used, and never twice
+    in a row across reshuffles.
+    """
+
+    def __init__(self, seed: Optional[int] = None):
+        self.seed = seed
+        self._sessions: Dict[str, _SessionState] = {}
+        self._rng = random.Random(seed)
+
+    def _session(self, session_id: str) -> _SessionState:
+        state = self._sessions.get(session_id)
+        if state is None:
+            rng = random.Random(f"{self.seed}:{session_id}") if self.seed is not None else random.Random()
+            # setdefault keeps the first state if two threads race on a new session
+            state = self._sessions.setdefault(session_id, _SessionState(rng))
+        return state
+
+    def choose(self, session_id: str, category: str, options: Sequence[str]) -> str:
+        count = len(options)
+        if count == 1:
+            return options[0]
+
+        state = self._session(session_id)
+        rotation = state.rotations.get(category)
+        if rotation is None:
+            rotation = state.rotations[category] = _Rotation()
+
+        if rotation.position >= len(rotation.order) or len(rotation.order) != count:
+            last = rotation.order[rotation.position - 1] if rotation.order and rotation.position else None
+            order = list(range(count))
+            state.rng.shuffle(order)
+            # Don't let the new round open with the reply that closed the previous one
+            if order[0] == last:
+                swap = state.rng.randrange(1, count)
+                order[0], order[swap] = order[swap], order[0]
+            rotation.order = order
+            rotation.position = 0
+
+        index = rotation.order[rotation.position]
+        rotation.position += 1
+        return options[index]
+
+    def pick(self, options: Sequence[str]) -> str:
+        """A reply for a caller that never becomes a session; keeps no per-session state"""
+        return self._rng.choice(options)
+
+    def forget(self, session_id: str):
+        self._sessions.pop(session_id, None)
@@ -0,0 +1,176 @@
+# response_templates.py
+import json
+import keyword
+import re
+import string
+from types import MappingProxyType
+from typing import Callable, Dict, Mapping, Optional
+
+DEFAULT_LOCALE = "en"
+
+# A filter after "|" in a field, with an optional integer argument: {title|truncate(100)}
+FILTER_RE = re.compile(r"^([a-z_]+)(?:\((\d+)\))?$")
+
+
+def _truncate(value, length: int) -> str:
+    text = str(value)
+    return text if len(text) <= length else text[:length] + "..."
+
+
+FILTERS = {
+    "truncate": _truncate,
+    "capitalize": lambda value: str(value).capitalize(),
+    "title": lambda value: str(value).title(),
+    "upper": lambda value: str(value).upper(),
+    "lower": lambda value: str(value).lower(),
+}
+
+# Built-in English replies of the API handlers, keyed "intent.message"
+DEFAULT_TEMPLATES = {
+    "weather.no_key": "Please configure your OpenWeatherMap API key to get weather data.",
+    "weather.report": ("Weather in {city}, {country}:\n"
+                       "• Temperature: {temp}°C (feels like {feels_like}°C)\n"
+                       "• Conditions: {description|capitalize}\n"
+                       "• Humidity: {humidity}%\n"
+                       "• Wind: {wind_speed} m/s\n"
+                       "• Icon: http://openweathermap.org/img/wn/{icon}@2x.png"),
+    "weather.fetch_failed": ("I couldn't fetch the weather data for {location}. "
+                             "Please try again later or check if the city name is correct."),
+    "weather.error": "An error occurred while fetching weather data: {error}",
+
+    "news.no_key": "Please configure your NewsAPI key to get news data.",
+    "news.empty": "No {category} news found right now. Please try another category.",
+    "news.headlines": "Here are the latest {category} news headlines:\n{headlines}",
+    "news.headline": "{index}. {title|truncate(100)} ({source})",
+    "news.fetch_failed": ("I couldn't fetch the latest news. "
+                          "Please check your internet connection or try again later."),
+    "news.error": "An error occurred while fetching news: {error}",
+
+    "currency.no_key": "Please configure your ExchangeRate API key to get currency data.",
+    "currency.unavailable": "Sorry, I couldn't retrieve the exchange rate at the moment.",
+    "currency.rate": ("Exchange Rate:\n"
+                      "• {base} ({base_symbol}) to {target} ({target_symbol})\n"
+                      "• Rate: 1 {base} = {rate:.4f} {target}\n"
+                      "• Last updated: {updated}"),
+    "currency.conversion": ("Exchange Rate:\n"
+                            "• {base} ({base_symbol}) to {target} ({target_symbol})\n"
+                            "• Rate: 1 {base} = {rate:.4f} {target}\n"
+                            "• {amount:,.2f} {base} = {converted:,.2f} {target}\n"
+                            "• Last updated: {updated}"),
+    "currency.fetch_failed": ("I couldn't fetch the exchange rate. "
+                              "Please check your internet connection or try again later."),
+    "currency.error": "An error occurred while fetching exchange rates: {error}",
+}
+
+
+class TemplateError(ValueError):
+    """Raised when a response template cannot be compiled"""
+
+
+def compile_template(source: str, name: str = "<template>") -> Callable[..., str]:
+    """Turn a template into a function that renders it from keyword arguments
+
+    Templates use str.format syntax limited to plain names ({rate:.4f}, {title!r}),
+    plus filters after "|" ({title|truncate(100)}). The template is parsed once and
+    compiled to a single f-string, so rendering costs about as much as the inline
+    formatting it replaces. Unused keyword arguments are ignored, which lets a
+    locale drop a value the default template shows.
+    """
+    try:
+        parsed = list(string.Formatter().parse(source))
+    except ValueError as e:
+        raise TemplateError(f"{name}: {e}") from None
+
+    pieces = []
+    names = []
+    namespace = {}
+    for literal, field_name, spec, conversion in parsed:
+        pieces.append(literal.replace("{", "{{").replace("}", "}}"))
+        if field_name is None:
+            continue
+
+        field_name, *filters = field_name.split("|")
+        if not field_name.isidentifier() or keyword.iskeyword(field_name) or field_name.startswith("_"):
+            raise TemplateError(f"{name}: invalid field {{{field_name}}}")
+        if any(char in spec for char in "{}'\"\\"):
+            raise TemplateError(f"{name}: unsupported format spec {spec!r} in {{{field_name}}}")
+        if conversion and conversion not in "rsa":
+            raise TemplateError(f"{name}: unknown conversion !{conversion} in {{{field_name}}}")
+
+        expression = field_name
+        for filter_text in filters:
+            match = FILTER_RE.match(filter_text.strip())
+            if not match or match.group(1) not in FILTERS:
+                raise TemplateError(f"{name}: unknown filter {filter_text!r} in {{{field_name}}}")
+            filter_name, argument = match.groups()
+            namespace[f"_{filter_name}"] = FILTERS[filter_name]
+            expression = f"_{filter_name}({expression}{', ' + argument if argument else ''})"
+
+        if field_name not in names:
+            names.append(field_name)
+        pieces.append("{" + expression + (f"!{conversion}" if conversion else "")
+                      + (f":{spec}" if spec else "") + "}")
+
+    parameters = f"*, {', '.join(names)}, **_" if names else "**_"
+    code = f"lambda {parameters}: f{''.join(pieces)!r}"
+    try:
+        render = eval(compile(code, f"<template {name}>", "eval"), {"__builtins__": {}, **namespace})
+    except SyntaxError as e:
+        raise TemplateError(f"{name}: {e.msg}") from None
+    render.source = source
+    render.fields = tuple(names)
+    return render
+
+
+class TemplateCatalog:
+    """Response templates for every locale, compiled once and shared by all sessions
+
+    Templates are keyed "intent.message" ("weather.report"). A locale only lists
+    the templates it changes; the rest come from the default locale. Merging
+    happens at load time, so rendering is one dict lookup and one call.
+    """
+
+    def __init__(self, templates: Dict[str, Dict[str, str]], default_locale: str = DEFAULT_LOCALE):
+        if default_locale not in templates:
+            raise TemplateError(f"no templates for the default locale {default_locale!r}")
+        self.default_locale = default_locale
+
+        base = {key: compile_template(source, f"{default_locale}:{key}")
+                for key, source in templates[default_locale].items()}
+        self.locales: Dict[str, Mapping[str, Callable[..., str]]] = {default_locale: MappingProxyType(base)}
+        for locale, entries in templates.items():
+            if locale == default_locale:
+                continue
+            unknown = sorted(set(entries) - set(base))
+            if unknown:
+                raise TemplateError(f"{locale}: unknown templates {', '.join(unknown)}")
+            compiled = dict(base)
+            compiled.update((key, compile_template(source, f"{locale}:{key}")) for key, source in entries.items())
+            self.locales[locale] = MappingProxyType(compiled)
+
+    def for_locale(self, locale: Optional[str]) -> Mapping[str, Callable[..., str]]:
+        """Templates for a locale; "es_MX" or "es-MX" falls back to "es", then to the default"""
+        if locale:
+            locale = locale.replace("-", "_")
+            for candidate in (locale, locale.split("_")[0]):
+                if candidate in self.locales:
+                    return self.locales[candidate]
+        return self.locales[self.default_locale]
+
+    def render(self, locale: Optional[str], key: str, **values) -> str:
+        return self.for_locale(locale)[key](**values)
+
+
+def load_templates(path: str = "response_templates.json") -> TemplateCatalog:
+    """Built-in English templates, overridden and extended per locale by a JSON file
+
+    The file maps locale codes to {"intent.message": template} objects.
+    """
+    templates = {DEFAULT_LOCALE: dict(DEFAULT_TEMPLATES)}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            for locale, entries in json.load(f).items():
+                templates.setdefault(locale, {}).update(entries)
+    except FileNotFoundError:
+        pass
+    return TemplateCatalog(templates)
@@ -0,0 +1,92 @@
+# tenants.py
+import json
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from chatbot_gui import AIChatBot, SharedResources
+from config_loader import Settings, get_settings
+from introspection import Introspector, IntrospectionServer
+
+
+@dataclass(frozen=True)
+class TenantConfig:
+    """What one branded bot changes relative to the shared defaults"""
+
+    tenant_id: str
+    name: str = "SupportBot"
+    greetings: Optional[List[str]] = None
+    farewells: Optional[List[str]] = None
+    locale: Optional[str] = None
+    faq_overrides: Dict[str, List[str]] = field(default_factory=dict)
+
+    def overrides(self) -> Dict[str, tuple]:
+        """FAQ categories this tenant replaces, including its greetings and farewells"""
+        overrides = {category: tuple(answers) for category, answers in self.faq_overrides.items()}
+        if self.greetings:
+            overrides["greeting"] = tuple(self.greetings)
+        if self.farewells:
+            overrides["farewell"] = tuple(self.farewells)
+        return overrides
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "TenantConfig":
+        return cls(
+            tenant_id=data["tenant_id"],
+            name=data.get("name", "SupportBot"),
+            greetings=data.get("greetings"),
+            farewells=data.get("farewells"),
+            locale=data.get("locale"),
+            faq_overrides=data.get("faq_overrides", {}),
+        )
+
+
+class TenantRuntime:
+    """Hosts several branded bots on one shared copy of the common data
+
+    Each tenant gets its own AIChatBot, so sessions, dialogue state and reply
+    rotations are namespaced per tenant, while FAQ answers, jokes, currencies, reply
+    templates, the typo index, HTTP pool, exchange rates and admission limits exist
+    only once. Tenants may answer in different locales from the same templates.
+    """
+
+    def __init__(self, settings: Optional[Settings] = None):
+        self.shared = SharedResources(settings or get_settings())
+        self.bots: Dict[str, AIChatBot] = {}
+        self.introspector = Introspector(self.shared, self.bots)
+        self.introspection: Optional[IntrospectionServer] = None
+        if self.shared.settings.introspection_port:
+            self.serve_introspection(self.shared.settings.introspection_port)
+
+    def add_tenant(self, config: TenantConfig) -> AIChatBot:
+        bot = AIChatBot(shared=self.shared, tenant_id=config.tenant_id, name=config.name,
+                        faq_overrides=config.overrides(), locale=config.locale)
+        if config.greetings:
+            bot.greetings = list(config.greetings)
+        if config.farewells:
+            bot.farewells = list(config.farewells)
+        self.bots[config.tenant_id] = bot
+        return bot
+
+    def remove_tenant(self, tenant_id: str):
+        self.bots.pop(tenant_id, None)
+
+    def get(self, tenant_id: str) -> AIChatBot:
+        return self.bots[tenant_id]
+
+    def answer_query(self, tenant_id: str, user_id: str, user_input: str) -> tuple:
+        return self.bots[tenant_id].answer_query(user_id, user_input)
+
+    def apply_settings(self, settings: Settings):
+        for bot in self.bots.values():
+            bot.apply_settings(settings)
+
+    def serve_introspection(self, port: int = 0) -> IntrospectionServer:
+        """Expose health, readiness and counters for every tenant on a localhost port (0 picks one)"""
+        if self.introspection is None:
+            self.introspection = IntrospectionServer(self.introspector, port).start()
+        return self.introspection
+
+    def load_tenants(self, path: str) -> List[AIChatBot]:
+        """Add every tenant listed in a JSON file (a list of TenantConfig fields)"""
+        with open(path, "r", encoding="utf-8") as f:
+            return [self.add_tenant(TenantConfig.from_dict(entry)) for entry in json.load(f)]
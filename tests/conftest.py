@@ -0,0 +1,7 @@
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+# Data files (faq_responses.json, city_timezones.json, ...) are read from the working directory
+os.chdir(ROOT)
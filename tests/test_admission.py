@@ -0,0 +1,62 @@
+import pytest
+
+from admission import AdmissionController
+from chatbot_gui import AIChatBot
+from config_loader import Settings
+
+
+@pytest.fixture
+def bot():
+    bot = AIChatBot(seed=0, settings=Settings())
+    bot.calls = []
+    for intent in bot.API_BACKED_INTENTS:
+        bot.api_handlers[intent] = lambda query, intent=intent: bot.calls.append(
+            (intent, bot.admission.stats()["in_flight"])) or "ok"
+    return bot
+
+
+@pytest.mark.parametrize("messages", [
+    ["what's the weather in london?", "and in paris?"],
+    ["wether in berlin"],
+])
+def test_api_handlers_hold_an_api_slot(bot, messages):
+    for message in messages:
+        bot.answer_query("u1", message)
+    assert bot.calls and all(in_flight == 1 for _, in_flight in bot.calls)
+    assert bot.admission.stats()["in_flight"] == 0
+
+
+def test_local_answers_take_no_api_slot(bot):
+    bot.answer_query("u1", "how do I reset my password?")
+    assert bot.calls == []
+    assert bot.admission.stats()["admitted"] == 0
+
+
+def test_api_call_is_busy_without_a_slot(bot):
+    bot.admission.max_queued = 0
+    bot.admission.in_flight = bot.admission.max_in_flight
+    assert bot.answer_query("u1", "what's the weather in london?")[1] == "busy"
+    assert bot.answer_query("u1", "tell me a joke")[1] == "joke"
+
+
+def test_query_slots_are_limited_with_a_reserve():
+    admission = AdmissionController(max_in_flight=1, max_queued=1, cheap_reserve=1)
+    assert [admission.enter() for _ in range(4)] == [True, True, True, False]
+    admission.leave()
+    assert admission.enter()
+
+
+def test_rejected_queries_leave_no_session_state(bot):
+    bot.admission.queries_in_flight = bot.admission.max_queries
+    for n in range(100):
+        assert bot.answer_query(f"user_{n}", "tell me a joke")[1] == "busy"
+    assert bot.sessions == {} and bot.responses._sessions == {}
+
+
+def test_shed_follow_up_keeps_the_open_question(bot):
+    assert bot.answer_query("u1", "what's the weather in paris?")[1] == "weather"
+    bot.admission.max_queued = 0
+    bot.admission.in_flight = bot.admission.max_in_flight
+    assert bot.answer_query("u1", "and in london?")[1] == "busy"
+    bot.admission.in_flight = 0
+    assert bot.answer_query("u1", "and in berlin?")[1] == "weather"
@@ -0,0 +1,104 @@
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from analytics import (columns_from_log, columns_from_sessions, hourly_profile, intent_counts,
+                       latency_percentiles, response_times, volume_by_bucket)
+from conversation_log import ConversationLog
+
+START = datetime(2026, 1, 5, 9, 30, tzinfo=timezone.utc)
+
+# (user, seconds after START, kind, response type)
+TURNS = [
+    ("u1", 0, "user", ""),
+    ("u2", 10, "user", ""),
+    ("u2", 13, "bot", "text"),
+    ("u1", 1, "bot", "weather"),
+    ("u2", 20, "user", ""),
+    ("u1", 3600, "user", ""),
+    ("u1", 3602, "bot", "text"),
+]
+
+
+def at(seconds):
+    return START + timedelta(seconds=seconds)
+
+
+@pytest.fixture
+def sessions():
+    sessions = {}
+    for user_id, seconds, kind, response_type in TURNS:
+        history = sessions.setdefault(user_id, {"history": []})["history"]
+        entry = {"timestamp": at(seconds), "type": kind}
+        if kind == "bot":
+            entry["response_type"] = response_type
+        history.append(entry)
+    return sessions
+
+
+@pytest.fixture
+def log_dir(tmp_path):
+    log = ConversationLog(str(tmp_path))
+    for user_id, seconds, kind, response_type in TURNS:
+        log.append(user_id, kind, "text is not read", response_type, timestamp=at(seconds))
+    log.close()
+    return str(tmp_path)
+
+
+def test_columns_from_sessions(sessions):
+    columns = columns_from_sessions(sessions)
+    assert len(columns) == 7
+    assert sorted(columns.user_names) == ["u1", "u2"]
+    assert columns.timestamps.dtype == np.float64
+
+
+def test_intent_counts_most_frequent_first(sessions):
+    assert list(intent_counts(columns_from_sessions(sessions)).items()) == [("text", 2), ("weather", 1)]
+
+
+def test_volume_by_bucket_counts_user_messages(sessions):
+    hour = at(0).replace(minute=0).timestamp()
+    assert volume_by_bucket(columns_from_sessions(sessions)) == {hour: 3, hour + 3600: 1}
+
+
+def test_hourly_profile(sessions):
+    columns = columns_from_sessions(sessions)
+    profile = hourly_profile(columns)
+    assert profile[9] == 3 and profile[10] == 1 and profile.sum() == 4
+    shifted = hourly_profile(columns, utc_offset_hours=2)
+    assert shifted[11] == 3 and shifted[12] == 1
+
+
+def test_response_times_pair_each_query_with_its_reply(sessions):
+    columns = columns_from_sessions(sessions)
+    latencies, types = response_times(columns)
+    pairs = sorted(zip(latencies.tolist(), [columns.type_names[code] for code in types]))
+    assert pairs == [(1.0, "weather"), (2.0, "text"), (3.0, "text")]
+
+
+def test_latency_percentiles_in_milliseconds(sessions):
+    report = latency_percentiles(columns_from_sessions(sessions), percentiles=(50, 100))
+    assert report == {"all": {"p50": 2000.0, "p100": 3000.0},
+                      "weather": {"p50": 1000.0, "p100": 1000.0},
+                      "text": {"p50": 2500.0, "p100": 3000.0}}
+
+
+def test_columns_from_log_match_sessions(log_dir, sessions):
+    from_log = columns_from_log(log_dir)
+    assert len(from_log) == 7
+    assert intent_counts(from_log) == intent_counts(columns_from_sessions(sessions))
+    assert sorted(response_times(from_log)[0].tolist()) == [1.0, 2.0, 3.0]
+
+
+def test_columns_from_log_time_window(log_dir):
+    columns = columns_from_log(log_dir, start=at(5).timestamp(), end=at(3600).timestamp())
+    assert len(columns) == 3
+    assert columns.user_names == ["u2"]
+
+
+def test_empty_columns():
+    columns = columns_from_sessions({})
+    assert intent_counts(columns) == {}
+    assert volume_by_bucket(columns) == {}
+    assert latency_percentiles(columns) == {}
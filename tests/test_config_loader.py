@@ -0,0 +1,54 @@
+import pytest
+
+from config_loader import ConfigError, Settings, load_settings
+
+
+def load(tmp_path, config_text=None, **environ):
+    config_file = tmp_path / "chatbot_config.json"
+    if config_text is not None:
+        config_file.write_text(config_text)
+    return load_settings(str(config_file), env_file=None, environ=environ)
+
+
+def test_defaults(tmp_path):
+    assert load(tmp_path) == Settings()
+
+
+def test_environment_values_are_typed(tmp_path):
+    settings = load(tmp_path, CHATBOT_HTTP_TIMEOUT="2.5", CHATBOT_MAX_SESSIONS="10", CHATBOT_SEED="7")
+    assert (settings.http_timeout, settings.max_sessions, settings.seed) == (2.5, 10, 7)
+
+
+@pytest.mark.parametrize("config_text", ["{not json", "[1]"])
+def test_malformed_config_file_is_a_config_error(tmp_path, config_text):
+    with pytest.raises(ConfigError, match="chatbot_config.json"):
+        load(tmp_path, config_text)
+
+
+@pytest.mark.parametrize("value", ["nan", "inf", "-inf"])
+def test_non_finite_floats_are_rejected(tmp_path, value):
+    with pytest.raises(ConfigError, match="CHATBOT_HTTP_TIMEOUT"):
+        load(tmp_path, CHATBOT_HTTP_TIMEOUT=value)
+
+
+@pytest.mark.parametrize("config_text, env_name", [
+    ('{"max_sessions": 2.7}', "CHATBOT_MAX_SESSIONS"),
+    ('{"http_timeout": true}', "CHATBOT_HTTP_TIMEOUT"),
+    ('{"seed": false}', "CHATBOT_SEED"),
+    ('{"locale": 5}', "CHATBOT_LOCALE"),
+    ('{"max_history": [1]}', "CHATBOT_MAX_HISTORY"),
+])
+def test_json_values_are_not_coerced(tmp_path, config_text, env_name):
+    with pytest.raises(ConfigError, match=env_name):
+        load(tmp_path, config_text)
+
+
+def test_json_numbers_of_the_right_kind_are_accepted(tmp_path):
+    settings = load(tmp_path, '{"max_sessions": 3.0, "http_timeout": 5, "locale": "es"}')
+    assert (settings.max_sessions, settings.http_timeout, settings.locale) == (3, 5.0, "es")
+
+
+def test_every_problem_is_reported(tmp_path):
+    with pytest.raises(ConfigError) as error:
+        load(tmp_path, '{"max_sesions": 3}', CHATBOT_MAX_HISTORY="lots")
+    assert "max_sesions" in str(error.value) and "CHATBOT_MAX_HISTORY" in str(error.value)
@@ -0,0 +1,76 @@
+import threading
+
+from conversation_log import ConversationLog, ConversationLogReader
+
+
+class FullDisk:
+    def tell(self):
+        return 0
+
+    def write(self, data):
+        raise OSError(28, "No space left on device")
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def test_turns_round_trip(tmp_path):
+    log = ConversationLog(str(tmp_path))
+    log.append("u1", "user", "hello")
+    log.append("u1", "bot", "Hi there!", "text")
+    log.close()
+    turns = list(ConversationLogReader(str(tmp_path)).scan("u1"))
+    assert [(turn.kind, turn.text) for turn in turns] == [("user", "hello"), ("bot", "Hi there!")]
+
+
+def test_write_errors_drop_turns_but_keep_the_writer(tmp_path, monkeypatch):
+    log = ConversationLog(str(tmp_path))
+    open_segment = log._open_segment
+
+    def full_disk():
+        log._file = FullDisk()
+
+    monkeypatch.setattr(log, "_open_segment", full_disk)
+    log.append("u1", "user", "lost")
+    log.flush()
+    stats = log.stats()
+    assert stats["dropped"] == 1 and "No space" in stats["last_error"]
+    assert stats["writer_alive"]
+
+    monkeypatch.setattr(log, "_open_segment", open_segment)
+    log.append("u1", "user", "kept")
+    log.close()
+    assert [turn.text for turn in ConversationLogReader(str(tmp_path)).scan()] == ["kept"]
+
+
+def test_unencodable_text_does_not_stop_the_writer(tmp_path):
+    log = ConversationLog(str(tmp_path))
+    log.append("u1", "user", "bad \ud800 text")
+    log.append("u1", "user", "good")
+    log.close()
+    assert log.stats()["dropped"] == 0
+    assert [turn.text for turn in ConversationLogReader(str(tmp_path)).scan()] == ["bad ? text", "good"]
+
+
+def test_full_queue_drops_and_counts_turns(tmp_path, monkeypatch):
+    log = ConversationLog(str(tmp_path), max_pending=2)
+    release = threading.Event()
+    write = log._write
+    monkeypatch.setattr(log, "_write", lambda entry: (release.wait(), write(entry)))
+    for n in range(5):
+        log.append("u1", "user", f"turn {n}")
+    release.set()
+    log.close()
+    stats = log.stats()
+    assert stats["dropped"] >= 2 and "full" in stats["last_error"]
+    assert len(list(ConversationLogReader(str(tmp_path)).scan())) == 5 - stats["dropped"]
+
+
+def test_flush_returns_when_the_writer_is_gone(tmp_path):
+    log = ConversationLog(str(tmp_path))
+    log.close()
+    log.append("u1", "user", "late")
+    log.flush()
@@ -0,0 +1,60 @@
+import pytest
+
+from chatbot_gui import AIChatBot
+from config_loader import Settings
+from dialogue_state import DialogueStateTracker
+
+
+@pytest.fixture(scope="module")
+def shared():
+    return AIChatBot(settings=Settings()).shared
+
+
+@pytest.fixture
+def bot(shared):
+    return AIChatBot(seed=0, shared=shared)
+
+
+def ask(bot, *messages):
+    for message in messages:
+        response, response_type = bot.get_response(message, "s1")
+    return response, response_type
+
+
+def test_faq_question_after_weather_is_not_a_follow_up(bot):
+    response, response_type = ask(bot, "what's the weather in london?", "and how do I reset my password?")
+    assert response_type == "text"
+    assert response in bot.faq_responses["account"]
+
+
+def test_thanks_after_time_is_not_a_follow_up(bot):
+    response, response_type = ask(bot, "what time is it in tokyo?", "and thanks!")
+    assert response_type == "text"
+    assert "You're welcome" in response
+
+
+def test_preposition_opener_is_not_a_follow_up(bot):
+    response, response_type = ask(bot, "what time is it in tokyo?", "for my order, where is it?")
+    assert response_type == "text"
+    assert response in bot.faq_responses["order"]
+
+
+def test_follow_up_to_known_city_reuses_intent(bot):
+    response, response_type = ask(bot, "what time is it in tokyo?", "and paris?")
+    assert response_type == "time"
+    assert "Paris" in response
+
+
+def test_unknown_place_is_not_a_follow_up(bot):
+    response, response_type = ask(bot, "what time is it in tokyo?", "and whatever else?")
+    assert response_type == "text"
+    assert response in bot.faq_responses["default"]
+
+
+def test_tracker_only_accepts_known_places():
+    tracker = DialogueStateTracker(AIChatBot.API_INTENT_KEYWORDS, AIChatBot.NEWS_CATEGORIES,
+                                   ["USD", "EUR"], AIChatBot.CURRENCY_NAMES, {"paris", "new york"})
+    tracker.update("s", "weather", "weather in paris")
+    assert tracker.resolve("s", "what about new york?") == ("weather", "weather in new york")
+    assert tracker.resolve("s", "and my cat?") is None
+    assert tracker.resolve("s", "in new york") is None
@@ -0,0 +1,115 @@
+import time
+
+import pytest
+import requests
+
+from chatbot_gui import AIChatBot
+from config_loader import Settings
+from fx_rates import ExchangeRateTable, find_amount
+
+
+class StubRates:
+    last_updated = "today"
+
+    def rate(self, base, target, api_key):
+        return 0.5
+
+
+@pytest.fixture
+def bot():
+    bot = AIChatBot(seed=0, settings=Settings(exchangerate_api_key="test-key"))
+    bot.fx_rates = StubRates()
+    return bot
+
+
+def test_currency_names_keep_their_order(bot):
+    reply = bot.get_exchange_rate("convert 20 dollars to euros")
+    assert "USD ($) to EUR (€)" in reply
+    assert "20.00 USD = 10.00 EUR" in reply
+
+
+def test_currency_codes_keep_their_order(bot):
+    assert "GBP (£) to JPY (¥)" in bot.get_exchange_rate("convert 250 gbp to jpy")
+
+
+def test_single_currency_name_is_the_base(bot):
+    assert "GBP (£) to EUR (€)" in bot.get_exchange_rate("how much is a pound worth")
+
+
+@pytest.mark.parametrize("query, amount", [
+    ("convert 250 gbp to jpy", 250.0),
+    ("how much is $1,200.50 in euros", 1200.5),
+    ("20 dollars to euros", 20.0),
+    ("exchange rate in 2024 usd to eur", None),
+    ("usd to eur for 3 people", None),
+])
+def test_only_numbers_next_to_a_currency_are_amounts(query, amount):
+    assert find_amount(query, {"usd", "eur", "gbp", "jpy", "$", "dollar", "euro"}) == amount
+
+
+def test_year_is_not_converted(bot):
+    reply = bot.get_exchange_rate("exchange rate in 2024 usd to eur")
+    assert "Rate: 1 USD = 0.5000 EUR" in reply and "2,024" not in reply
+
+
+class FakeResponse:
+    def __init__(self, data):
+        self.data = data
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.data
+
+
+class FakeProvider:
+    def __init__(self, *replies):
+        self.replies = list(replies)
+        self.calls = 0
+
+    def get(self, url, timeout=None):
+        self.calls += 1
+        reply = self.replies[min(self.calls, len(self.replies)) - 1]
+        if isinstance(reply, Exception):
+            raise reply
+        return FakeResponse(reply)
+
+
+def table_data(next_update):
+    return {"result": "success", "conversion_rates": {"USD": 1.0, "EUR": 0.5},
+            "time_last_update_utc": "today", "time_next_update_unix": next_update}
+
+
+def test_overdue_provider_update_still_caches_the_table():
+    provider = FakeProvider(table_data(time.time() - 10))
+    table = ExchangeRateTable(http=provider)
+    for _ in range(5):
+        assert table.rate("USD", "EUR", "key") == 0.5
+    assert provider.calls == 1
+
+
+def test_failed_refreshes_back_off():
+    provider = FakeProvider({"result": "error", "error-type": "quota-reached"})
+    table = ExchangeRateTable(http=provider)
+    assert [table.rate("USD", "EUR", "key") for _ in range(5)] == [None] * 5
+    assert provider.calls == 1 and table.failures == 1
+
+
+def test_stale_table_is_served_while_refresh_fails():
+    provider = FakeProvider(table_data(None), requests.exceptions.ConnectionError("down"))
+    table = ExchangeRateTable(ttl=0, http=provider)
+    assert table.rate("USD", "EUR", "key") == 0.5
+    for _ in range(5):
+        assert table.rate("USD", "EUR", "key") == 0.5
+    assert provider.calls == 2 and table.failures == 1
+
+    table._retry_at = 0.0
+    table.rate("USD", "EUR", "key")
+    assert provider.calls == 3
+
+
+def test_first_fetch_error_is_raised():
+    table = ExchangeRateTable(http=FakeProvider(requests.exceptions.ConnectionError("down")))
+    with pytest.raises(requests.exceptions.ConnectionError):
+        table.rate("USD", "EUR", "key")
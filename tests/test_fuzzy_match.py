@@ -0,0 +1,17 @@
+from chatbot_gui import AIChatBot
+from config_loader import Settings
+
+
+def test_common_words_are_not_corrected_to_keywords():
+    corrector = AIChatBot(settings=Settings()).typo_corrector
+    assert corrector.correct("i think so") == "i think so"
+    assert corrector.correct("i forgot my passport") == "i forgot my passport"
+    assert corrector.correct("pick a short film") == "pick a short film"
+    assert corrector.correct("thnaks a lot") == "thanks a lot"
+
+
+def test_cache_size_comes_from_settings():
+    bot = AIChatBot(settings=Settings(typo_cache_size=2))
+    for token in ("weahter", "forcast", "curency"):
+        bot.typo_corrector.correct_token(token)
+    assert bot.typo_corrector.stats()["cached"] <= 2
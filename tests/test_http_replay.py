@@ -0,0 +1,51 @@
+import os
+from datetime import timedelta
+
+import requests
+from requests.adapters import BaseAdapter
+
+import http_replay
+from http_replay import CassetteAdapter, CassetteStore
+
+URL = "https://api.example.com/rates?key=secret"
+
+
+class FakeUpstream(BaseAdapter):
+    def send(self, request, **kwargs):
+        response = http_replay.build_response(request, {"status": 200, "body": '{"rate": 2}'})
+        response.elapsed = timedelta(seconds=0.25)
+        return response
+
+    def close(self):
+        pass
+
+
+def session_with(adapter):
+    session = requests.Session()
+    session.mount("https://", adapter)
+    return session
+
+
+def test_recordings_are_saved_once_on_close(tmp_path):
+    path = str(tmp_path / "cassette.json.gz")
+    store = CassetteStore(path, ["secret"])
+    session = session_with(CassetteAdapter(store, "record", FakeUpstream()))
+    for _ in range(3):
+        session.get(URL)
+    assert not os.path.exists(path)
+
+    session.close()
+    assert len(CassetteStore(path).entries["GET https://api.example.com/rates?key=***"]) == 3
+
+
+def test_replay_without_latency_uses_recorded_time(tmp_path, monkeypatch):
+    path = str(tmp_path / "cassette.json.gz")
+    store = CassetteStore(path, ["secret"])
+    store.add("GET", URL, FakeUpstream().send(requests.Request("GET", URL).prepare()))
+    store.save()
+
+    delays = []
+    monkeypatch.setattr(http_replay.time, "sleep", delays.append)
+    replay = session_with(CassetteAdapter(CassetteStore(path, ["other"]), "replay", latency=None))
+    assert replay.get(URL.replace("secret", "other")).json() == {"rate": 2}
+    assert delays == [0.25]
@@ -0,0 +1,81 @@
+import json
+import urllib.error
+import urllib.request
+
+import pytest
+
+from chatbot_gui import AIChatBot
+from config_loader import Settings
+from conversation_log import ConversationLog
+from introspection import IntrospectionServer, Introspector, ProviderStats, deep_sizeof
+
+
+def test_provider_error_rates_and_failing():
+    stats = ProviderStats(window=4)
+    for ok in (False, False, True, True, False, False, False):
+        stats.record("newsapi", ok, 0.1, None if ok else "HTTP 500")
+    stats.record("openweathermap", True, 0.3)
+
+    report = stats.stats()
+    assert report["newsapi"]["calls"] == 7 and report["newsapi"]["errors"] == 5
+    assert report["newsapi"]["error_rate"] == pytest.approx(5 / 7)
+    assert report["newsapi"]["recent_error_rate"] == 0.75
+    assert report["newsapi"]["last_error"] == "HTTP 500"
+    assert report["openweathermap"]["avg_latency_ms"] == pytest.approx(300.0)
+    assert stats.failing() == ["newsapi"]
+
+
+def test_deep_sizeof_counts_shared_objects_once():
+    shared = ["x" * 1000]
+    alone = deep_sizeof(shared)
+    seen = set()
+    assert deep_sizeof({"a": shared}, seen) > alone
+    assert deep_sizeof({"b": shared}, seen) < alone
+    assert deep_sizeof([shared, shared]) < 2 * alone
+
+
+@pytest.fixture
+def server():
+    bot = AIChatBot(settings=Settings())
+    server = IntrospectionServer(Introspector(bot.shared, {"default": bot})).start()
+    yield server
+    server.stop()
+
+
+def get(server, path):
+    host, port = server.address
+    try:
+        with urllib.request.urlopen(f"http://{host}:{port}{path}") as response:
+            return response.status, json.load(response)
+    except urllib.error.HTTPError as e:
+        return e.code, json.load(e)
+
+
+def test_ready_by_default(server):
+    assert get(server, "/healthz")[1]["status"] == "ok"
+    status, body = get(server, "/readyz")
+    assert status == 200 and body["status"] == "ready"
+    assert get(server, "/stats")[1]["bots"]["default"]["sessions"] == 0
+    assert get(server, "/nowhere")[0] == 404
+
+
+def test_not_ready_when_admission_is_saturated(server):
+    admission = server.introspector.shared.admission
+    admission.queries_in_flight = admission.max_queries
+    status, body = get(server, "/readyz")
+    assert status == 503 and body["status"] == "not_ready"
+    assert body["checks"]["accepting_queries"] is False
+
+
+def test_not_ready_when_log_writer_is_dead(server, tmp_path):
+    log = ConversationLog(str(tmp_path))
+    log.close()
+    server.introspector.shared.conversation_log = log
+    status, body = get(server, "/readyz")
+    assert status == 503 and body["checks"]["conversation_log"] is False
+
+
+def test_failing_provider_degrades_readiness(server):
+    server.introspector.shared.provider_stats.record("newsapi", False, 0.1, "ConnectionError")
+    status, body = get(server, "/readyz")
+    assert status == 200 and body["status"] == "degraded" and body["failing_providers"] == ["newsapi"]
@@ -0,0 +1,47 @@
+import threading
+import time
+
+from profiling import QueryProfiler
+
+
+class SlowBot:
+    def process_query(self, user_id, user_input):
+        time.sleep(0.05)
+        return user_input, "text"
+
+
+def test_profiled_requests_run_concurrently(tmp_path):
+    bot = SlowBot()
+    profiler = QueryProfiler(bot, str(tmp_path))
+    profiler.start(requests=100)
+    threads = [threading.Thread(target=bot.process_query, args=(f"u{n}", "hi")) for n in range(8)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    outputs = profiler.stop()
+
+    assert elapsed < 8 * 0.05 / 2
+    assert not profiler.active
+    assert outputs[0].endswith(".pstats")
+    with open(outputs[-1]) as f:
+        assert "process_query" in f.read()
+
+
+def test_sample_summary_without_samples(tmp_path):
+    profiler = QueryProfiler(SlowBot(), str(tmp_path))
+    profiler.mode = "sample"
+    assert profiler._sample_summary().startswith("0 samples")
+
+
+def test_windows_in_the_same_second_get_separate_files(tmp_path):
+    bot = SlowBot()
+    profiler = QueryProfiler(bot, str(tmp_path))
+    outputs = []
+    for mode in ("sample", "cprofile"):
+        profiler.start(requests=100, mode=mode)
+        bot.process_query("u1", "hi")
+        outputs += profiler.stop()
+    assert len(outputs) == len(set(outputs)) == 4
@@ -0,0 +1,27 @@
+import pytest
+
+from chatbot_gui import AIChatBot
+from config_loader import Settings
+from response_selector import ResponseSelector
+
+
+def test_rotation_uses_every_reply_before_repeating():
+    selector = ResponseSelector(seed=1)
+    options = ("a", "b", "c")
+    picks = [selector.choose("s", "greeting", options) for _ in range(30)]
+    for start in range(0, 30, 3):
+        assert sorted(picks[start:start + 3]) == ["a", "b", "c"]
+    assert all(first != second for first, second in zip(picks, picks[1:]))
+
+
+def test_same_seed_gives_same_replies():
+    options = ("a", "b", "c", "d")
+    first, second = ResponseSelector(seed=7), ResponseSelector(seed=7)
+    assert ([first.choose("s", "x", options) for _ in range(8)]
+            == [second.choose("s", "x", options) for _ in range(8)])
+
+
+def test_empty_faq_override_is_rejected():
+    shared = AIChatBot(settings=Settings()).shared
+    with pytest.raises(ValueError, match="busy"):
+        AIChatBot(shared=shared, faq_overrides={"busy": [], "contact": ["Email us"]})
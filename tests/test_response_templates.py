@@ -0,0 +1,14 @@
+import pytest
+
+from response_templates import TemplateError, compile_template
+
+
+def test_renders_filters_and_conversions():
+    render = compile_template("{title|truncate(3)} {name!r} {rate:.2f}")
+    assert render(title="headline", name="x", rate=1.5, unused=1) == "hea... 'x' 1.50"
+
+
+@pytest.mark.parametrize("source", ["{x!z}", "{x!}", "{x|shout}", "{1x}", "{x:{y}}", "{x"])
+def test_invalid_templates_raise_template_error(source):
+    with pytest.raises(TemplateError):
+        compile_template(source, "test")
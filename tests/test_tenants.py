@@ -0,0 +1,59 @@
+import json
+
+import pytest
+
+from config_loader import Settings
+from tenants import TenantConfig, TenantRuntime
+
+
+@pytest.fixture
+def runtime():
+    runtime = TenantRuntime(Settings())
+    runtime.add_tenant(TenantConfig("acme", name="AcmeBot", greetings=["Welcome to Acme!"],
+                                    faq_overrides={"payment": ["Pay at acme.example.com/billing"]}))
+    runtime.add_tenant(TenantConfig("globex", name="GlobexBot", locale="es"))
+    return runtime
+
+
+def test_tenants_share_one_copy_of_common_data(runtime):
+    acme, globex = runtime.get("acme"), runtime.get("globex")
+    assert acme.shared is globex.shared is runtime.shared
+    assert acme.jokes is globex.jokes is runtime.shared.jokes
+    assert globex.faq_responses is runtime.shared.faq_responses
+    assert acme.faq_responses.maps[1] is runtime.shared.faq_responses
+
+
+def test_same_user_id_has_separate_state_per_tenant(runtime):
+    assert runtime.answer_query("acme", "u1", "what time is it in tokyo?")[1] == "time"
+    assert "u1" in runtime.get("acme").sessions
+    assert "u1" not in runtime.get("globex").sessions
+
+    # The follow-up only resolves against the tenant that heard the first question
+    assert runtime.answer_query("globex", "u1", "and in paris?")[1] == "text"
+    assert runtime.answer_query("acme", "u1", "and in paris?")[1] == "time"
+
+    runtime.answer_query("acme", "u1", "tell me a joke")
+    acme_rotations = runtime.get("acme").responses._sessions["u1"].rotations
+    globex_rotations = runtime.get("globex").responses._sessions["u1"].rotations
+    assert "joke" in acme_rotations and "joke" not in globex_rotations
+
+
+def test_faq_overrides_apply_per_tenant(runtime):
+    assert runtime.answer_query("acme", "u1", "where do I pay my bill?")[0] == "Pay at acme.example.com/billing"
+    assert runtime.answer_query("globex", "u1", "where do I pay my bill?")[0] in runtime.shared.faq_responses["payment"]
+    assert runtime.get("acme").greetings == ["Welcome to Acme!"]
+    assert runtime.get("globex").greetings != ["Welcome to Acme!"]
+
+
+def test_locale_applies_per_tenant(runtime):
+    assert runtime.answer_query("acme", "u1", "latest technology news")[0].startswith("Please configure")
+    assert runtime.answer_query("globex", "u1", "latest technology news")[0].startswith("Configure su clave")
+
+
+def test_load_tenants_from_file(tmp_path):
+    path = tmp_path / "tenants.json"
+    path.write_text(json.dumps([{"tenant_id": "a"}, {"tenant_id": "b", "locale": "es"}]))
+    runtime = TenantRuntime(Settings())
+    runtime.load_tenants(str(path))
+    assert sorted(runtime.bots) == ["a", "b"]
+    assert runtime.get("b").locale == "es"
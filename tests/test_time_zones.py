@@ -0,0 +1,35 @@
+import pytest
+
+from time_zones import TimeService
+
+
+@pytest.fixture(scope="module")
+def service():
+    return TimeService()
+
+
+@pytest.mark.parametrize("query, expected", [
+    ("what time is it in tokyo", ("tokyo", "Asia/Tokyo")),
+    ("time in new york city", ("new york city", "America/New_York")),
+    ("what time is it in the uk", ("uk", None)),
+    ("time in atlantis", ("atlantis", None)),
+])
+def test_places_after_in(service, query, expected):
+    assert service.find_city(query) == expected
+
+
+@pytest.mark.parametrize("query", [
+    "what time is it at the moment",
+    "remind me of the time",
+    "time for lunch?",
+    "what is the date of easter",
+    "what's the date for today",
+    "time for tea",
+])
+def test_non_places_give_local_time(service, query):
+    assert service.find_city(query) == (None, None)
+    assert service.describe(query).startswith("Current time in Your Location")
+
+
+def test_unknown_city_is_reported(service):
+    assert service.describe("time in atlantis").startswith("Sorry, I don't know the time zone for Atlantis")
@@ -0,0 +1,166 @@
+# time_zones.py
+import json
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+from zoneinfo import ZoneInfo, available_timezones
+
+WORD_RE = re.compile(r"[^\W\d_]+")
+PREPOSITIONS = {"in", "at", "for", "of"}
+# Words after a preposition that are not places ("the date for today", "time for lunch")
+NOT_PLACES = {
+    "today", "tomorrow", "tonight", "now", "me", "us", "you", "it", "this", "that", "my", "your",
+    "here", "there", "right", "a", "an",
+    # the time intent's own keywords and other time words
+    "time", "date", "clock", "calendar", "day", "moment", "minute", "hour", "week", "month", "year",
+    "morning", "afternoon", "evening", "night", "weekend",
+    # occasions people ask the time or date of
+    "lunch", "dinner", "breakfast", "work", "school", "bed", "meeting", "easter", "christmas",
+    "halloween", "thanksgiving", "birthday",
+}
+
+# Common names the gazetteer spells differently
+CITY_ALIASES = {
+    "nyc": "America/New_York",
+    "la": "America/Los_Angeles",
+    "sf": "America/Los_Angeles",
+    "san francisco": "America/Los_Angeles",
+    "washington dc": "America/New_York",
+    "hong kong": "Asia/Hong_Kong",
+    "saint petersburg": "Europe/Moscow",
+    "st petersburg": "Europe/Moscow",
+}
+
+
+def load_city_timezones() -> Dict[str, str]:
+    """Map lower-case city names to IANA time zones
+
+    city_timezones.json lists every city of 100,000+ people (GeoNames data, CC BY 4.0),
+    largest first. Without it the index falls back to the cities named in the time
+    zone database itself (Europe/Paris, America/New_York, ...).
+    """
+    try:
+        with open('city_timezones.json', 'r', encoding='utf-8') as f:
+            cities = json.load(f)
+    except FileNotFoundError:
+        cities = {}
+
+    for zone in sorted(available_timezones()):
+        if "/" in zone and not zone.startswith(("Etc/", "SystemV/")):
+            cities.setdefault(zone.rsplit("/", 1)[-1].replace("_", " ").lower(), zone)
+    for alias, zone in CITY_ALIASES.items():
+        cities.setdefault(alias, zone)
+    return cities
+
+
+class TimeService:
+    """Answers "what time is it in <city>" from a prebuilt city index
+
+    ZoneInfo objects are created once per zone, and formatted replies are memoized
+    for the current second, so repeated questions about a city cost a dict lookup.
+    """
+
+    def __init__(self, cities: Optional[Dict[str, str]] = None):
+        self.cities = cities if cities is not None else load_city_timezones()
+        self.longest_name = max((len(name.split()) for name in self.cities), default=1)
+        self._zones: Dict[str, ZoneInfo] = {}
+        self._replies: Dict[str, str] = {}
+        self._replies_second = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def zone(self, name: str) -> ZoneInfo:
+        zone = self._zones.get(name)
+        if zone is None:
+            zone = self._zones[name] = ZoneInfo(name)
+        return zone
+
+    def find_city(self, query: str) -> tuple:
+        """Return (city, zone name) for the place asked about; city is None if none is named
+
+        A place follows "in"/"at"/"for"/"of"; the longest known name among the next
+        words wins ("new york city" over "new york"). Multi-word names also match
+        without a preposition ("new york time"). Only an unknown name after "in" is
+        reported as an unknown city; after the other prepositions it is usually not
+        a place at all ("time for tea"), so the local time is given instead.
+        """
+        words = WORD_RE.findall(query.lower())
+        for i, word in enumerate(words):
+            if word in PREPOSITIONS and i + 1 < len(words):
+                candidate = words[i + 1:i + 1 + self.longest_name]
+                if candidate[0] == "the":
+                    candidate = candidate[1:]
+                if not candidate or candidate[0] in NOT_PLACES:
+                    continue
+                match = self._longest_match(candidate)
+                if match:
+                    return match
+                if word == "in":
+                    return " ".join(candidate[:2]), None
+
+        for i in range(len(words)):
+            match = self._longest_match(words[i:i + self.longest_name], min_words=2)
+            if match:
+                return match
+        return None, None
+
+    def _longest_match(self, words: List[str], min_words: int = 1) -> Optional[tuple]:
+        for length in range(len(words), min_words - 1, -1):
+            name = " ".join(words[:length])
+            zone = self.cities.get(name)
+            if zone:
+                return name, zone
+        return None
+
+    def describe(self, query: str) -> str:
+        city, zone_name = self.find_city(query)
+        now = time.time()
+        second = int(now)
+        key = f"{city}|{zone_name}"
+
+        with self._lock:
+            if second != self._replies_second:
+                self._replies = {}
+                self._replies_second = second
+            reply = self._replies.get(key)
+        if reply is not None:
+            self.hits += 1
+            return reply
+
+        self.misses += 1
+        reply = self.format_reply(city, zone_name, second)
+        with self._lock:
+            if second == self._replies_second:
+                self._replies[key] = reply
+        return reply
+
+    def stats(self) -> dict:
+        return {
+            "cities": len(self.cities),
+            "zones_loaded": len(self._zones),
+            "replies_cached": len(self._replies),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def format_reply(self, city: Optional[str], zone_name: Optional[str], timestamp: float) -> str:
+        utc_now = datetime.fromtimestamp(timestamp, timezone.utc)
+        if city and not zone_name:
+            return (f"Sorry, I don't know the time zone for {city.title()}.\n"
+                    f"• UTC: {utc_now.strftime('%H:%M:%S')}")
+
+        if zone_name:
+            now = utc_now.astimezone(self.zone(zone_name))
+            offset = now.strftime('%z')
+            heading = f"Current time in {city.title()} ({now.tzname()}, UTC{offset[:3]}:{offset[3:]})"
+        else:
+            now = utc_now.astimezone()
+            heading = "Current time in Your Location"
+
+        return (f"{heading}:\n"
+                f"• Time: {now.strftime('%H:%M:%S')}\n"
+                f"• Date: {now.strftime('%A, %B %d, %Y')}\n"
+                f"• UTC: {utc_now.strftime('%H:%M:%S')}")